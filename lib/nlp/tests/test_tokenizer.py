@@ -773,3 +773,13 @@ class TestTokenizer(unittest.TestCase):
         text = "Tanguy Ndombele told Jose Mourinho he never wants to play for him again following a clash earlier this week"
         t = Tokenizer(pos=[ 'NN', 'NNS', 'NNP', 'NNPS' ])
         self.assertEqual([ 'Tanguy', 'Ndombele', 'Jose', 'Mourinho', 'clash', 'week' ], t._pos(text))
+
+    def test_tokens_interned(self):
+        """
+        Test that the same token in different texts is the same string.
+        """
+
+        t = Tokenizer(case_fold=True, stem=False)
+        first, second = t.tokenize("Arsenal score"), t.tokenize("ARSENAL concede")
+        self.assertEqual('arsenal', first[0])
+        self.assertTrue(first[0] is second[0])
@@ -272,6 +272,12 @@ class Tokenizer(object):
         tokens = [ token for token in tokens if len(token) >= self.min_length ]
         tokens = self._stem(tokens) if self.stem else tokens
 
+        """
+        Intern the tokens so that all documents share the same string for the same token.
+        This saves memory, and dictionaries keyed by the tokens, such as the :class:`~vsm.vector.VectorSpace`, can compare keys by identity.
+        """
+        tokens = [ sys.intern(token) for token in tokens ]
+
         return tokens
 
     def _split_hashtags(self, string):
@@ -73,12 +73,14 @@ class Queue(object):
         Dequeue all elements in the queue.
         Unlike the :func:`~queues.Queue.empty` function, this function returns all of the queue's elements.
 
+        The function does not copy the elements.
+        Instead, it returns the queue's list and replaces it with a new, empty list.
+
         :return: All the elements in the queue.
         :rtype: list
         """
 
-        elements = list(self.queue)
-        self.empty()
+        elements, self.queue = self.queue, [ ]
         return elements
 
     def empty(self):
@@ -507,7 +507,7 @@ class ELDConsumer(Consumer):
         for item in tweets:
             tweet = item.attributes['tweet'] if type(item) is Document else item
 
-            text = twitter.full_text(tweet)
+            timestamp, text, _ = twitter.parse_tweet(tweet)
 
             """
             Create the document and save the tweet in it.
@@ -516,7 +516,7 @@ class ELDConsumer(Consumer):
             document = item if type(item) is Document else Document(text, tokens, scheme=self.scheme)
             document.attributes['id'] = tweet.get('id')
             document.attributes['urls'] = len(tweet['entities']['urls'])
-            document.attributes['timestamp'] = twitter.extract_timestamp(tweet)
+            document.attributes['timestamp'] = timestamp
             document.attributes['tweet'] = tweet
             document.normalize()
             documents.append(document)
@@ -613,7 +613,7 @@ class ELDConsumer(Consumer):
 
         until = timestamp - self.time_window * self.sets
         if until > 0:
-            self.store.remove(*self.store.until(until))
+            self.store.remove_many(self.store.until(until))
 
     def _cluster(self, documents):
         """
@@ -178,7 +178,7 @@ class ZhaoConsumer(SimulatedBufferedConsumer):
         """
         tokenizer = Tokenizer(stopwords=stopwords.words("english"), remove_unicode_entities=True)
         for tweet in tweets:
-            text = twitter.full_text(tweet)
+            timestamp, text, _ = twitter.parse_tweet(tweet)
 
             """
             Create the document and save the tweet in it.
@@ -186,7 +186,7 @@ class ZhaoConsumer(SimulatedBufferedConsumer):
             tokens = tokenizer.tokenize(text)
             document = Document(text, tokens, scheme=self.scheme)
             document.attributes["tweet"] = tweet
-            document.attributes['timestamp'] = twitter.extract_timestamp(tweet)
+            document.attributes['timestamp'] = timestamp
             document.normalize()
             documents.append(document)
 
@@ -142,6 +142,17 @@ class TestQueue(unittest.TestCase):
         self.assertEqual(list(range(0, 10)), queue.dequeue_all())
         self.assertFalse(queue.length())
 
+    def test_dequeue_all_then_enqueue(self):
+        """
+        Test that adding elements to the queue after dequeuing all of its elements does not change the dequeued elements.
+        """
+
+        queue = Queue(*list(range(0, 10)))
+        elements = queue.dequeue_all()
+        queue.enqueue(10)
+        self.assertEqual(list(range(0, 10)), elements)
+        self.assertEqual([ 10 ], queue.queue)
+
     def test_empty_empty_queue(self):
         """
         Test that emptying an empty queue changes nothing.
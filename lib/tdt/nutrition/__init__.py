@@ -165,6 +165,17 @@ class NutritionStore(ABC):
 
         pass
 
+    def remove_many(self, timestamps):
+        """
+        Remove nutrition data from the given timestamps.
+        Unlike the :func:`~tdt.nutrition.NutritionStore.remove` function, the timestamps are given as an iterable, such as a list or the dictionary returned by :func:`~tdt.nutrition.NutritionStore.until`.
+
+        :param timestamps: The timestamps whose nutrition data should be removed.
+        :type timestamps: iterable
+        """
+
+        self.remove(*timestamps)
+
     @abstractmethod
     def copy(self):
         """
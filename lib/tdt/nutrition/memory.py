@@ -5,6 +5,7 @@ However, since all of the nutrition data is stored in memory, you need to pay at
 Like all :class:`~tdt.nutrition.NutritionStore` instances, you can clear out old data to keep the memory requirements in check.
 """
 
+import bisect
 import copy
 import os
 import sys
@@ -28,10 +29,25 @@ class MemoryNutritionStore(NutritionStore):
     In addition, the :class:`~tdt.nutrition.memory.MemoryNutritionStore` does not impose any restrictions on the nutrition data.
     It can represent objects and different timestamps can have different data types.
 
+    To retrieve nutrition data between two timestamps quickly, the store also keeps a sorted list of its timestamps.
+    This list is updated when adding and removing nutrition data.
+    It is rebuilt if the ``store`` dictionary is replaced, or if its size changes without using these functions.
+
+    .. note::
+
+        Change the nutrition data using the :func:`~tdt.nutrition.memory.MemoryNutritionStore.add` and :func:`~tdt.nutrition.memory.MemoryNutritionStore.remove` functions.
+        If you change the timestamps in the ``store`` dictionary directly, but keep its size, the sorted timestamps cannot notice the change.
+
     :ivar store: The nutrition store as a dictionary.
                  The keys are the timestamps, and the values are the nutrition data.
                  The nutrition data can be any value.
     :vartype store: dict
+    :ivar _timestamps: The timestamps in the store, sorted in ascending order.
+                       If the list is ``None``, it is rebuilt the next time that it is needed.
+    :vartype _timestamps: list of float or None
+    :ivar _indexed: The dictionary whose timestamps are in the sorted list.
+                    If the ``store`` is replaced, the sorted timestamps are rebuilt the next time that they are needed.
+    :vartype _indexed: dict or None
     """
 
     def __init__(self):
@@ -40,6 +56,7 @@ class MemoryNutritionStore(NutritionStore):
         """
 
         self.store = { }
+        self._timestamps, self._indexed = None, None
 
     def add(self, timestamp, nutrition):
         """
@@ -56,7 +73,21 @@ class MemoryNutritionStore(NutritionStore):
         :type nutrition: any
         """
 
-        self.store[float(timestamp)] = nutrition
+        timestamp = float(timestamp)
+        store = self.store
+
+        """
+        Keep the sorted timestamps up-to-date if the timestamp is new.
+        Nutrition data is normally added chronologically, so the timestamp can usually just be appended.
+        """
+        synced = self._synced()
+        if synced and timestamp not in store:
+            if not self._timestamps or self._timestamps[-1] < timestamp:
+                self._timestamps.append(timestamp)
+            else:
+                bisect.insort(self._timestamps, timestamp)
+
+        store[timestamp] = nutrition
 
     def get(self, timestamp):
         """
@@ -107,16 +138,69 @@ class MemoryNutritionStore(NutritionStore):
         if float(start) >= float(end):
             raise ValueError(f"The start timestamp must be before the end timestamp: {start} >= {end}")
 
-        return { timestamp: self.get(timestamp) for timestamp in self.store if float(start) <= float(timestamp) < float(end) }
+        timestamps = self._sorted()
+        lo = bisect.bisect_left(timestamps, float(start))
+        hi = bisect.bisect_left(timestamps, float(end), lo)
+        return { timestamp: self.store[timestamp] for timestamp in timestamps[lo:hi] }
+
+    def since(self, start):
+        """
+        Get the nutrition data since the given timestamp.
+
+        .. note::
+
+            The start timestamp is inclusive.
+
+        :param start: The first timestamp that should be included in the returned nutrition data.
+                      If no time window with the given timestamp exists, all returned time windows succeed it.
+        :type start: float or int
+
+        :return: All the nutrition data from the given timestamp onward.
+        :rtype: dict
+        """
+
+        timestamps = self._sorted()
+        if timestamps:
+            return self.between(start, timestamps[-1] + 1)
+
+        return { }
 
     def remove(self, *args):
         """
         Remove nutrition data from the given list of timestamps.
         The timestamps should be given as arguments.
+
+        The data is removed from the store in-place, so removing old data does not rebuild the store.
+        """
+
+        self.remove_many(args)
+
+    def remove_many(self, timestamps):
+        """
+        Remove nutrition data from the given timestamps.
+        Unlike the :func:`~tdt.nutrition.memory.MemoryNutritionStore.remove` function, the timestamps are given as an iterable, such as a list or the dictionary returned by :func:`~tdt.nutrition.NutritionStore.until`.
+
+        :param timestamps: The timestamps whose nutrition data should be removed.
+        :type timestamps: iterable
         """
 
-        timestamps = [ float(timestamp) for timestamp in args ]
-        self.store = { timestamp: self.store.get(timestamp) for timestamp in self.store if timestamp not in timestamps }
+        """
+        The timestamps are copied first because they may be the store itself or one of its views, which cannot be iterated while removing data.
+        Remove the timestamps from the sorted timestamps as well, so that they do not need to be rebuilt.
+        The timestamps are removed from the end of the list first so that the positions of the other removed timestamps do not change.
+        """
+        store, timestamps = self.store, list(timestamps)
+        synced, positions = self._synced(), [ ]
+        for timestamp in timestamps:
+            timestamp = float(timestamp)
+            if timestamp in store:
+                del store[timestamp]
+                if synced:
+                    positions.append(bisect.bisect_left(self._timestamps, timestamp))
+
+        if synced:
+            for position in sorted(positions, reverse=True):
+                del self._timestamps[position]
 
     def copy(self):
         """
@@ -129,9 +213,52 @@ class MemoryNutritionStore(NutritionStore):
         """
 
         store = MemoryNutritionStore()
+        store.store = { timestamp: self._copy(data) for timestamp, data in self.store.items() }
+        return store
 
-        copy_data = copy.deepcopy(self.all())
-        for timestamp, data in copy_data.items():
-            store.add(timestamp, data)
+    def _synced(self):
+        """
+        Check whether the sorted timestamps are up-to-date with the store.
 
-        return store
+        :return: A boolean indicating whether the sorted timestamps are up-to-date with the store.
+        :rtype: bool
+        """
+
+        return (self._timestamps is not None and self._indexed is self.store and
+                len(self._timestamps) == len(self.store))
+
+    def _sorted(self):
+        """
+        Get the timestamps in the store, sorted in ascending order.
+        If the sorted timestamps are out of sync with the store, the function rebuilds them.
+
+        :return: The timestamps in the store, sorted in ascending order.
+        :rtype: list of float
+        """
+
+        if not self._synced():
+            self._timestamps, self._indexed = sorted(self.store), self.store
+
+        return self._timestamps
+
+    def _copy(self, data):
+        """
+        Create a deep copy of the given nutrition data.
+        Nutrition data is usually made up of dictionaries, lists and numbers, which the function copies without calling :func:`copy.deepcopy`.
+        Immutable values are shared with the original, and any other object is copied with :func:`copy.deepcopy`.
+
+        :param data: The nutrition data to copy.
+        :type data: any
+
+        :return: A deep copy of the nutrition data.
+        :rtype: any
+        """
+
+        if type(data) is dict:
+            return { key: self._copy(value) for key, value in data.items() }
+        elif type(data) is list:
+            return [ self._copy(value) for value in data ]
+        elif type(data) in (int, float, str, bool) or data is None:
+            return data
+
+        return copy.deepcopy(data)
@@ -268,6 +268,115 @@ class TestMemoryNutritionStore(unittest.TestCase):
         nutrition.add(20, 2)
         self.assertEqual({ 10: 1}, nutrition.between(1, 19))
 
+    def test_between_unordered(self):
+        """
+        Test that getting nutrition data between two timestamps works even if the data is not added chronologically.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(20, 2)
+        self.assertEqual({ 20: 2 }, nutrition.between(0, 30))
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.add(30, 3)
+        self.assertEqual({ 10: 1, 20: 2 }, nutrition.between(1, 30))
+
+    def test_between_after_overwrite(self):
+        """
+        Test that overwriting nutrition data does not duplicate it when getting nutrition data between two timestamps.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(10, 1)
+        self.assertEqual({ 10: 1 }, nutrition.between(0, 20))
+        nutrition.add(10, 2)
+        self.assertEqual({ 10: 2 }, nutrition.between(0, 20))
+
+    def test_between_after_remove(self):
+        """
+        Test that removed nutrition data is not returned when getting nutrition data between two timestamps.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.add(20, 2)
+        self.assertEqual({ 0: 0, 10: 1, 20: 2 }, nutrition.between(0, 30))
+        nutrition.remove(10)
+        self.assertEqual({ 0: 0, 20: 2 }, nutrition.between(0, 30))
+        nutrition.add(10, 1)
+        self.assertEqual({ 0: 0, 10: 1, 20: 2 }, nutrition.between(0, 30))
+
+    def test_between_after_remove_many(self):
+        """
+        Test that removed nutrition data is not returned when getting nutrition data between two timestamps, even after adding more data.
+        """
+
+        nutrition = MemoryNutritionStore()
+        for timestamp in range(0, 60, 10):
+            nutrition.add(timestamp, timestamp)
+        self.assertEqual({ 0: 0, 10: 10, 20: 20, 30: 30, 40: 40, 50: 50 }, nutrition.between(0, 60))
+
+        nutrition.remove_many([ 40, 0, 10, 100 ])
+        self.assertEqual({ 20: 20, 30: 30, 50: 50 }, nutrition.between(0, 60))
+        self.assertEqual({ 30: 30, 50: 50 }, nutrition.since(25))
+
+        nutrition.add(40, 4)
+        nutrition.add(5, 5)
+        self.assertEqual({ 5: 5, 20: 20, 30: 30, 40: 4 }, nutrition.between(0, 50))
+        self.assertEqual({ 40: 4, 50: 50 }, nutrition.since(40))
+
+    def test_since_after_trimming_store(self):
+        """
+        Test that when nutrition data is removed directly from the store, it is not returned when getting nutrition data since a timestamp.
+        """
+
+        nutrition = MemoryNutritionStore()
+        for timestamp in range(0, 40, 10):
+            nutrition.add(timestamp, timestamp)
+        self.assertEqual({ 10: 10, 20: 20, 30: 30 }, nutrition.since(10))
+
+        del nutrition.all()[20]
+        self.assertEqual({ 10: 10, 30: 30 }, nutrition.since(10))
+        self.assertEqual({ 0: 0, 10: 10 }, nutrition.between(0, 30))
+
+        nutrition.add(20, 2)
+        self.assertEqual({ 10: 10, 20: 2, 30: 30 }, nutrition.since(10))
+
+    def test_between_after_replacing_store(self):
+        """
+        Test that when the store is replaced with a dictionary of the same size, the new nutrition data is returned.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        self.assertEqual({ 0: 0, 10: 1 }, nutrition.between(0, 30))
+        nutrition.store = { 5: 5, 20: 2 }
+        self.assertEqual({ 5: 5, 20: 2 }, nutrition.between(0, 30))
+        self.assertEqual({ 20: 2 }, nutrition.since(10))
+
+        nutrition.add(10, 1)
+        self.assertEqual({ 5: 5, 10: 1, 20: 2 }, nutrition.between(0, 30))
+        self.assertEqual({ 10: 1, 20: 2 }, nutrition.since(10))
+
+    def test_between_copy(self):
+        """
+        Test that getting nutrition data between two timestamps from a copy of the nutrition store returns the same data.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.add(20, 2)
+        self.assertEqual({ 0: 0, 10: 1 }, nutrition.between(0, 20))
+
+        copy = nutrition.copy()
+        self.assertEqual({ 0: 0, 10: 1 }, copy.between(0, 20))
+        copy.add(5, 5)
+        self.assertEqual({ 0: 0, 5: 5, 10: 1 }, copy.between(0, 20))
+        self.assertEqual({ 0: 0, 10: 1 }, nutrition.between(0, 20))
+
     def test_since_empty(self):
         """
         Test that when getting nutrition data since a timestamp from an empty store, an empty dictionary is returned.
@@ -544,3 +653,93 @@ class TestMemoryNutritionStore(unittest.TestCase):
 
         self.assertEqual({ 'value': 1 }, copy.get(0))
         self.assertEqual([ 'value', 2 ], copy.get(10))
+
+    def test_copy_deep_nested(self):
+        """
+        Test that editing nested nutrition data in the copy of the nutrition store does not change the original.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, { 'a': { 'b': 1 }, 'c': [ 1, 2 ] })
+
+        copy = nutrition.copy()
+        copy.get(0)['a']['b'] = 2
+        copy.get(0)['c'].append(3)
+
+        self.assertEqual({ 'a': { 'b': 1 }, 'c': [ 1, 2 ] }, nutrition.get(0))
+        self.assertEqual({ 'a': { 'b': 2 }, 'c': [ 1, 2, 3 ] }, copy.get(0))
+
+    def test_copy_deep_objects(self):
+        """
+        Test that the copy of the nutrition store also copies nutrition data that is neither a dictionary nor a list.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, { 'a': { 1, 2 } })
+
+        copy = nutrition.copy()
+        copy.get(0)['a'].add(3)
+
+        self.assertEqual({ 'a': { 1, 2 } }, nutrition.get(0))
+        self.assertEqual({ 'a': { 1, 2, 3 } }, copy.get(0))
+
+    def test_remove_many_list(self):
+        """
+        Test removing multiple timestamps given as a list.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.add(20, 2)
+        nutrition.add(30, 3)
+        nutrition.remove_many([ '10', 20 ])
+        self.assertEqual({ 0: 0, 30: 3 }, nutrition.all())
+
+    def test_remove_many_empty(self):
+        """
+        Test that when no timestamps are provided, the nutrition data is unchanged.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.remove_many([ ])
+        self.assertEqual({ 0: 0, 10: 1 }, nutrition.all())
+
+    def test_remove_many_until(self):
+        """
+        Test removing timestamps that come until the given timestamp without unpacking them.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.add(20, 2)
+        nutrition.add(30, 3)
+        nutrition.remove_many(nutrition.until(20))
+        self.assertEqual({ 20: 2, 30: 3}, nutrition.all())
+        self.assertEqual({ 20: 2 }, nutrition.between(0, 30))
+
+    def test_remove_many_all(self):
+        """
+        Test removing all timestamps by passing the store's own data.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.remove_many(nutrition.all())
+        self.assertEqual({ }, nutrition.all())
+
+    def test_remove_many_keys(self):
+        """
+        Test removing timestamps by passing a view of the store's own timestamps.
+        """
+
+        nutrition = MemoryNutritionStore()
+        nutrition.add(0, 0)
+        nutrition.add(10, 1)
+        nutrition.remove_many(nutrition.all().keys())
+        self.assertEqual({ }, nutrition.all())
+        self.assertEqual({ }, nutrition.between(0, 20))
@@ -3,7 +3,13 @@ The Twitter package is used to facilitate collecting, reading and processing twe
 At the package-level there are functions to help with general processing tasks.
 """
 
-from dateutil.parser import parse
+import calendar
+
+MONTHS = { 'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+           'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12 }
+"""
+The abbreviated month names used in the ``created_at`` field of tweets, such as ``Wed Oct 10 20:19:24 +0000 2018``, and their numbers.
+"""
 
 def extract_timestamp(tweet):
     """
@@ -22,15 +28,38 @@ def extract_timestamp(tweet):
     :raises KeyError: When no timestamp field can be found.
     """
 
-    if 'timestamp_ms' in tweet:
-        timestamp_ms = int(tweet["timestamp_ms"])
-        timestamp_ms = timestamp_ms - timestamp_ms % 1000
-        return timestamp_ms / 1000.
-    elif 'created_at' in tweet:
-        return parse(tweet['created_at']).timestamp()
+    timestamp_ms = tweet.get('timestamp_ms')
+    if timestamp_ms is not None:
+        return int(timestamp_ms) // 1000
+
+    created_at = tweet.get('created_at')
+    if created_at is not None:
+        return parse_created_at(created_at)
 
     raise KeyError("Neither the 'timestamp_ms' attribute, nor the 'created_at' attribute could be found in the tweet.")
 
+def parse_created_at(created_at):
+    """
+    Parse the given ``created_at`` field of a tweet, such as ``Wed Oct 10 20:19:24 +0000 2018``, into a timestamp.
+    Twitter always uses the same format, so the function splits the field into its parts instead of using a general-purpose parser.
+
+    :param created_at: The ``created_at`` field of a tweet.
+    :type created_at: str
+
+    :return: The timestamp represented by the field.
+    :rtype: int
+    """
+
+    _, month, day, clock, offset, year = created_at.split()
+    hour, minute, second = clock.split(':')
+    timestamp = calendar.timegm((int(year), MONTHS[month], int(day), int(hour), int(minute), int(second)))
+
+    """
+    The timestamp is in the time zone of the offset, so shift it back to UTC.
+    """
+    shift = int(offset[1:3]) * 3600 + int(offset[3:5]) * 60
+    return timestamp - shift if offset[0] == '+' else timestamp + shift
+
 def full_text(tweet):
     """
     Extract the full text from the tweet.
@@ -48,8 +77,9 @@ def full_text(tweet):
     :rtype: str
     """
 
-    while "retweeted_status" in tweet:
-        tweet = tweet["retweeted_status"]
+    retweeted = tweet.get("retweeted_status")
+    while retweeted is not None:
+        tweet, retweeted = retweeted, retweeted.get("retweeted_status")
 
     if "extended_tweet" in tweet:
         text = tweet["extended_tweet"].get("full_text", tweet.get("text", ""))
@@ -71,3 +101,44 @@ def is_retweet(tweet):
     """
 
     return 'retweeted_status' in tweet
+
+def is_verified(tweet):
+    """
+    Check whether the given tweet is by a verified author.
+    The author's verification status is stored in the ``user`` object of the tweet.
+
+    :param tweet: The tweet to check.
+    :type tweet: dict
+
+    :return: A boolean indicating whether the tweet is by a verified author.
+    :rtype: bool
+    """
+
+    return tweet['user']['verified']
+
+def parse_tweet(tweet):
+    """
+    Extract the timestamp and the full text from the given tweet, and check whether it is a retweet.
+    This function is equivalent to calling :func:`~twitter.extract_timestamp`, :func:`~twitter.full_text` and :func:`~twitter.is_retweet`, but it walks the tweet only once.
+    Use it when you need all three values.
+
+    :param tweet: The tweet to parse.
+    :type tweet: dict
+
+    :return: A tuple containing the timestamp of the tweet, its full text and a boolean indicating whether it is a retweet.
+    :rtype: tuple of int, str and bool
+
+    :raises KeyError: When no timestamp field can be found.
+    """
+
+    original, retweeted = tweet, tweet.get('retweeted_status')
+    while retweeted is not None:
+        original, retweeted = retweeted, retweeted.get('retweeted_status')
+
+    extended = original.get('extended_tweet')
+    if extended is not None:
+        text = extended.get('full_text', original.get('text', ''))
+    else:
+        text = original.get('text', '')
+
+    return extract_timestamp(tweet), text, original is not tweet
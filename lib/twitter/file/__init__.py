@@ -13,6 +13,14 @@ from .. import *
 
 import asyncio
 import json
+import mmap
+import os
+import re
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 class FileReader(ABC):
     """
@@ -59,6 +67,21 @@ class FileReader(ABC):
     :vartype skip_unverified: bool
     """
 
+    CHUNK_SIZE = 2 ** 22
+    """
+    The number of bytes to read at a time when skipping lines.
+    """
+
+    TIMESTAMP_PATTERN = re.compile(r'"timestamp_ms"\s*:\s*"(\d+)"')
+    """
+    The pattern used to find the ``timestamp_ms`` attribute in a JSON-encoded tweet without decoding it.
+    """
+
+    VERIFIED_PATTERN = re.compile(r'"verified"\s*:\s*true')
+    """
+    The pattern used to find verified authors in a JSON-encoded tweet without decoding it.
+    """
+
     def __init__(self, queue, f, max_lines=-1, max_time=-1, skip_lines=0, skip_time=0,
                  skip_unverified=False, skip_retweets=False):
         """
@@ -68,6 +91,7 @@ class FileReader(ABC):
         :param queue: The queue to which to add the tweets.
         :type queue: :class:`~queues.Queue`
         :param f: The opened file from where to read the tweets.
+                  The file may be opened in text or binary mode.
         :type f: file
         :param max_lines: The maximum number of lines to read.
                           If the number is negative, it is ignored.
@@ -144,6 +168,9 @@ class FileReader(ABC):
         The rules to decide whether a tweet is valid is based on the parameters of this class:
 
         - ``skip_retweets``: if ``True``, this retweets are marked as invalid.
+        - ``skip_unverified``: if ``True``, tweets by unverified authors are marked as invalid.
+
+        The function returns as soon as one rule fails, starting with the cheapest rule.
 
         :param tweet: The tweet to consider.
         :type tweet: dict
@@ -152,9 +179,45 @@ class FileReader(ABC):
         :rtype: bool
         """
 
-        valid = not self.skip_retweets or not is_retweet(tweet)
-        valid = valid and (not self.skip_unverified or is_verified(tweet))
-        return valid
+        if self.skip_retweets and is_retweet(tweet):
+            return False
+
+        if self.skip_unverified and not is_verified(tweet):
+            return False
+
+        return True
+
+    def _valid_line(self, line):
+        """
+        Check whether the given line may be a valid tweet without decoding it.
+        The rules are the same as in the :func:`~twitter.file.FileReader.valid` function, but they look for the attributes in the raw line:
+
+        - ``skip_retweets``: if ``True``, lines with a ``retweeted_status`` attribute are marked as invalid.
+        - ``skip_unverified``: if ``True``, lines without any verified author are marked as invalid.
+
+        .. note::
+
+            Lines that pass this check can still be invalid.
+            For example, a tweet by an unverified author that quotes a verified author passes the check.
+            Therefore tweets should still be validated with the :func:`~twitter.file.FileReader.valid` function after decoding them.
+
+        Lines read from files opened in binary mode are decoded into strings first.
+
+        :param line: The line to consider, representing a JSON-encoded tweet.
+        :type line: str or bytes
+
+        :return: A boolean indicating whether the line may be a valid tweet.
+        :rtype: bool
+        """
+
+        line = line.decode() if type(line) is bytes else line
+        if self.skip_retweets and '"retweeted_status"' in line:
+            return False
+
+        if self.skip_unverified and not self.VERIFIED_PATTERN.search(line):
+            return False
+
+        return True
 
     def skip(self, lines, time):
         """
@@ -165,6 +228,11 @@ class FileReader(ABC):
 
             The number of lines and seconds that are skipped depend on the largest number.
 
+        .. note::
+
+            To skip time, the function assumes that the tweets in the file are sorted chronologically.
+            This allows it to bisect the file instead of reading every line that it skips.
+
         :param lines: The number of lines to skip.
         :type lines: int
         :param time: The number of seconds to skip from the beginning of the file.
@@ -180,34 +248,170 @@ class FileReader(ABC):
         line = file.readline()
         if not line:
             return
-        start = extract_timestamp(json.loads(line))
+        start = self._extract_timestamp(line)
         file.seek(0)
 
         """
         Skip a number of lines first.
         """
-        if lines >= 0:
-            for i in range(int(lines)):
-                file.readline()
+        if lines > 0:
+            file.seek(self._skip_lines(file.tell(), int(lines)))
 
         """
         Skip a number of seconds from the file.
+        The file is bisected first to get close to the first line that should not be skipped.
         Once a line that should not be skipped is skipped, the read is rolled back.
         """
+        if time > 0:
+            file.seek(self._bisect(file.tell(), start + time))
+
         pos = file.tell()
         line = file.readline()
         if not line:
             return
-        next = json.loads(line)
-        while extract_timestamp(next) - start < time:
+        while self._extract_timestamp(line) - start < time:
             pos = file.tell()
             line = file.readline()
             if not line:
                 break
-            next = json.loads(line)
 
         file.seek(pos)
 
+    def _skip_lines(self, start, lines):
+        """
+        Find the position in the file after skipping the given number of lines.
+        Instead of reading the file one line at a time, the function reads it in chunks and counts the line breaks in each chunk.
+
+        :param start: The position in the file from where to start skipping lines.
+        :type start: int
+        :param lines: The number of lines to skip.
+        :type lines: int
+
+        :return: The position of the first line that is not skipped.
+                 If the file has fewer lines than the number of lines to skip, the position is the end of the file.
+        :rtype: int
+        """
+
+        file = self.file
+        buffer = getattr(file, 'buffer', file)
+
+        pos = start
+        buffer.seek(pos)
+        while lines > 0:
+            chunk = buffer.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+
+            newline = b'\n' if type(chunk) is bytes else '\n'
+            found = chunk.count(newline)
+            if found < lines:
+                lines -= found
+                pos += len(chunk)
+                continue
+
+            """
+            The last line to skip ends in this chunk, so look for its line break.
+            """
+            end = -1
+            for i in range(lines):
+                end = chunk.index(newline, end + 1)
+            pos += end + 1
+            lines = 0
+
+        return pos
+
+    def _bisect(self, start, timestamp):
+        """
+        Bisect the file to find a line that was published before the given timestamp.
+        The function assumes that the tweets in the file are sorted chronologically.
+        All the lines between the start position and the returned position were published before the given timestamp.
+
+        The function probes the file directly in bytes, not in lines.
+        Therefore after every probe, it skips the rest of the line that it lands on.
+        If possible, the file is mapped into memory so that the probes only load the parts of the file that they touch.
+
+        :param start: The position in the file from where to start bisecting.
+                      This position should be at the beginning of a line.
+        :type start: int
+        :param timestamp: The timestamp to look for.
+        :type timestamp: float or int
+
+        :return: The position of a line in the file.
+                 All lines before this position were published before the given timestamp.
+        :rtype: int
+        """
+
+        file = self.file
+        lo, hi = start, file.seek(0, os.SEEK_END)
+
+        """
+        Files that cannot be mapped into memory, such as in-memory streams, are probed through their buffer instead.
+        """
+        try:
+            source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            source = getattr(file, 'buffer', file)
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            source.seek(mid)
+            source.readline()
+            pos = source.tell()
+            line = source.readline()
+            if line and self._extract_timestamp(line) < timestamp:
+                lo = pos
+            else:
+                hi = mid
+
+        if type(source) is mmap.mmap:
+            source.close()
+
+        return lo
+
+    def _extract_timestamp(self, line):
+        """
+        Extract the timestamp from the given line without decoding the entire tweet.
+        The function looks for the ``timestamp_ms`` attribute in the raw line.
+        Twitter adds this attribute at the end of each tweet, so the function looks for it starting from the end of the line.
+        Only if the line has no such attribute does the function decode the tweet and extract the timestamp from it.
+
+        Lines read from files opened in binary mode are decoded into strings first.
+
+        :param line: The line from which to extract the timestamp, representing a JSON-encoded tweet.
+        :type line: str or bytes
+
+        :return: The timestamp of the tweet.
+        :rtype: int
+
+        :raises KeyError: When no timestamp field can be found.
+        """
+
+        line = line.decode() if type(line) is bytes else line
+        pos = line.rfind('"timestamp_ms"')
+        match = self.TIMESTAMP_PATTERN.match(line, pos) if pos >= 0 else None
+        if match:
+            return int(match.group(1)) // 1000
+
+        return extract_timestamp(self._decode(line))
+
+    def _decode(self, line):
+        """
+        Decode the given line into a tweet.
+        If it is installed, the function decodes the line using :mod:`orjson`, which is several times faster than the standard :mod:`json` module.
+        Lines that :mod:`orjson` rejects, such as those with unpaired surrogates, are decoded with the standard :mod:`json` module instead.
+
+        :param line: The line to decode, representing a JSON-encoded tweet.
+        :type line: str
+
+        :return: The decoded tweet.
+        :rtype: dict
+        """
+
+        try:
+            return _loads(line)
+        except ValueError:
+            return json.loads(line)
+
     @abstractmethod
     async def read(self):
         """
@@ -9,7 +9,8 @@ Since the volume is likely to change, it also tests the :ref:`consumers' <consum
 """
 
 import asyncio
-import json
+import itertools
+import math
 import os
 import sys
 import time
@@ -35,6 +36,11 @@ class SimulatedFileReader(FileReader):
     :vartype speed: int
     """
 
+    BATCH_SIZE = 64
+    """
+    The maximum number of tweets to hold back before adding them to the queue together.
+    """
+
     def __init__(self, queue, f, speed=1, *args, **kwargs):
         """
         Create the :class:`~twitter.file.simulated_reader.SimulatedFileReader` with the file from where to read tweets and the :class:`~queues.Queue` where to store them.
@@ -43,6 +49,7 @@ class SimulatedFileReader(FileReader):
         :param queue: The queue to which to add the tweets.
         :type queue: :class:`~queues.Queue`
         :param f: The opened file from where to read the tweets.
+                  The file may be opened in text or binary mode.
         :type f: file
         :param speed: The reading speed, considered to be a function of time.
                       If it is set to 0.5, for example, the event progresses at half the speed.
@@ -68,51 +75,93 @@ class SimulatedFileReader(FileReader):
         Read the file and add each line as a dictionary to the queue.
         """
 
-        file = self.file
-
         """
-        Extract the timestamp from the first tweet, then reset the file pointer.
+        Extract the timestamp from the first tweet.
+        The first line is then put back in front of the rest of the lines, so the file pointer does not have to be reset.
+        The maximum number of lines limits the lines that the reader iterates over, so the loop does not have to count them.
         """
-        pos = file.tell()
-        line = file.readline()
+        lines = itertools.islice(self.file, self.max_lines) if self.max_lines >= 0 else iter(self.file)
+        line = next(lines, None)
         if not line:
             return
-        first = extract_timestamp(json.loads(line))
-        file.seek(pos)
+        first = self._extract_timestamp(line)
+        lines = itertools.chain([ line ], lines)
 
         """
         Go through each line and add it to the queue.
-        """
-        start = time.time()
-        for i, line in enumerate(file):
-            tweet = json.loads(line)
-            created_at = extract_timestamp(tweet)
-
-            """
-            If the maximum number of lines, or the time, has been exceeded, stop reading.
-            """
-            if self.max_lines >= 0 and i >= self.max_lines:
-                break
-
-            if self.max_time >= 0 and created_at - first >= self.max_time:
-                break
+        The reader only decodes a tweet once it has to check whether the tweet is valid.
+        Until then, it reads the timestamp directly from the line.
 
-            """
-            If the tweet is 'in the future', stop reading until the reader catches up.
-            It is only after it catches up that the tweet is added to the queue.
-            """
-            elapsed = time.time() - start
-            if (created_at - first) / self.speed > elapsed and self.active:
-                await asyncio.sleep((created_at - first) / self.speed - elapsed)
-
-            """
-            If the reader has been interrupted, stop reading.
-            """
-            if not self.active:
-                break
+        Valid tweets are added to the queue in batches, which is faster when the queue is shared between processes.
+        A batch is added to the queue when it is full, before waiting for the next tweet and whenever the reader stops reading.
+        """
+        batch, caught_up = [ ], first
 
+        """
+        Bind the attributes and functions that the loop uses to local names, which are faster to look up.
+        The maximum time is converted into the timestamp when the reader should stop reading.
+        The ``active`` flag is not bound because it can change while the reader is reading.
+        The reader measures the elapsed time with a monotonic clock, which is not affected by changes to the system clock.
+        """
+        until = first + self.max_time if self.max_time >= 0 else math.inf
+        speed = self.speed
+        filtered = self.skip_retweets or self.skip_unverified
+        extract, valid_line, decode, valid = self._extract_timestamp, self._valid_line, self._decode, self.valid
+        enqueue, append, now = self.queue.enqueue, batch.append, time.monotonic
+
+        start = now()
+        try:
+            for line in lines:
+                created_at = extract(line)
+
+                """
+                If the time has been exceeded, stop reading.
+                """
+                if created_at >= until:
+                    break
+
+                """
+                If the tweet is 'in the future', stop reading until the reader catches up.
+                It is only after it catches up that the tweet is added to the queue.
+                Tweets are usually published in bursts, so once the reader catches up with a second, the rest of the second's tweets are added without checking the time again.
+                """
+                if created_at > caught_up:
+                    delay = start + (created_at - first) / speed - now()
+                    if delay > 0 and self.active:
+                        if batch:
+                            enqueue(*batch)
+                            batch.clear()
+                        await asyncio.sleep(delay)
+                    caught_up = created_at
+
+                """
+                If the reader has been interrupted, stop reading.
+                """
+                if not self.active:
+                    break
+
+                """
+                Only add a tweet if it is valid.
+                Lines that are certainly invalid are skipped without decoding them.
+                If the reader does not skip any tweets, all tweets are valid, so they are not checked.
+                """
+                if filtered and not valid_line(line):
+                    continue
+
+                tweet = decode(line)
+                if not filtered or valid(tweet):
+                    append(tweet)
+                    if len(batch) >= self.BATCH_SIZE:
+                        enqueue(*batch)
+                        batch.clear()
+
+                        """
+                        Yield control after adding a full batch so that consumers can keep up during long bursts.
+                        """
+                        await asyncio.sleep(0)
+        finally:
             """
-            Only add a tweet if it is valid.
+            Add the remaining tweets to the queue however the reader stops, including when it is cancelled or a line cannot be read.
             """
-            if self.valid(tweet):
-                self.queue.enqueue(tweet)
+            if batch:
+                enqueue(*batch)
@@ -344,6 +344,30 @@ class TestSimulatedFileReader(unittest.IsolatedAsyncioTestCase):
             await reader.read()
             self.assertEqual(600, queue.length())
 
+    async def test_read_error_adds_read_tweets(self):
+        """
+        Test that when the reader fails to read a tweet, the tweets that it read before are still added to the queue.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+            queue = Queue()
+            reader = SimulatedFileReader(queue, f, speed=10)
+
+            """
+            Fail when decoding the 11th line.
+            """
+            decode, lines = reader._decode, set()
+            def _decode(line):
+                if line not in lines and len(lines) == 10:
+                    raise ValueError()
+                lines.add(line)
+                return decode(line)
+            reader._decode = _decode
+
+            with self.assertRaises(ValueError):
+                await reader.read()
+            self.assertEqual(10, queue.length())
+
     async def test_max_lines_excess(self):
         """
         Test that when reading excess lines, all lines are returned.
@@ -448,6 +472,20 @@ class TestSimulatedFileReader(unittest.IsolatedAsyncioTestCase):
                 else:
                     self.assertTrue(tweet in queue.queue)
 
+    async def test_skip_retweets_binary(self):
+        """
+        Test that when skipping retweets in a file opened in binary mode, the same tweets are read as in text mode.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'rb') as f:
+            queue = Queue()
+            reader = SimulatedFileReader(queue, f, speed=10, max_lines=20, skip_retweets=True)
+            await reader.read()
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+            tweets = [ json.loads(f.readline()) for i in range(20) ]
+            self.assertEqual([ tweet for tweet in tweets if not is_retweet(tweet) ], queue.queue)
+
     async def test_no_skip_retweets(self):
         """
         Test that when not skipping retweets, all of the tweets in the corpus are retained.
@@ -523,3 +561,106 @@ class TestSimulatedFileReader(unittest.IsolatedAsyncioTestCase):
             self.assertTrue(queue.length())
             self.assertTrue(not any( is_retweet(tweet) for tweet in queue.queue ))
             self.assertTrue(any( is_verified(tweet) for tweet in queue.queue ))
+
+    def test_extract_timestamp_from_line(self):
+        """
+        Test that extracting the timestamp from the raw line returns the same timestamp as when decoding the tweet.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+            reader = SimulatedFileReader(Queue(), f)
+            f.seek(0)
+            for line in f:
+                self.assertEqual(extract_timestamp(json.loads(line)), reader._extract_timestamp(line))
+
+    def test_extract_timestamp_from_binary_line(self):
+        """
+        Test that extracting the timestamp from a raw line read in binary mode returns the same timestamp as when decoding the tweet.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'rb') as f:
+            reader = SimulatedFileReader(Queue(), f)
+            f.seek(0)
+            for line in f:
+                self.assertEqual(extract_timestamp(json.loads(line)), reader._extract_timestamp(line))
+
+    async def test_read_binary(self):
+        """
+        Test that reading a file opened in binary mode returns the same tweets as when reading it in text mode.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'rb') as f:
+            queue = Queue()
+            reader = SimulatedFileReader(queue, f, speed=10, max_lines=100)
+            await reader.read()
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+            self.assertEqual([ json.loads(f.readline()) for i in range(100) ], queue.queue)
+
+    def test_skip_time_same_as_linear(self):
+        """
+        Test that skipping time moves the file pointer to the first tweet that should not be skipped, as if the reader read all the skipped lines.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+            lines = f.readlines()
+            start = extract_timestamp(json.loads(lines[0]))
+            end = extract_timestamp(json.loads(lines[-1]))
+
+        for skip in range(0, int(end - start) + 2):
+            expected = [ line for line in lines if extract_timestamp(json.loads(line)) - start >= skip ]
+            with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+                reader = SimulatedFileReader(Queue(), f, skip_time=skip)
+                self.assertEqual(expected, f.readlines())
+
+    def test_skip_time_binary(self):
+        """
+        Test that skipping time in a file opened in binary mode moves the file pointer to the same line as in text mode.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'rb') as f:
+            lines = f.readlines()
+            timestamps = [ extract_timestamp(json.loads(line)) for line in lines ]
+            start, end = timestamps[0], timestamps[-1]
+
+        for skip in range(0, int(end - start) + 2):
+            expected = [ line for line, timestamp in zip(lines, timestamps) if timestamp - start >= skip ]
+            with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'rb') as f:
+                reader = SimulatedFileReader(Queue(), f, skip_time=skip)
+                self.assertEqual(expected, f.readlines())
+
+    def test_decode(self):
+        """
+        Test that decoding a line returns the same tweet as the standard JSON module.
+        """
+
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+            reader = SimulatedFileReader(Queue(), f)
+            f.seek(0)
+            for line in f:
+                self.assertEqual(json.loads(line), reader._decode(line))
+
+    def test_decode_unpaired_surrogate(self):
+        """
+        Test that decoding a line with an unpaired surrogate returns the same tweet as the standard JSON module.
+        """
+
+        line = '{"text": "Hello \\ud83d", "timestamp_ms": "1539202764999"}'
+        with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+            reader = SimulatedFileReader(Queue(), f)
+            self.assertEqual(json.loads(line), reader._decode(line))
+
+    def test_valid_line_keeps_valid_tweets(self):
+        """
+        Test that checking the raw line never rejects a valid tweet.
+        """
+
+        for skip_retweets in [ False, True ]:
+            for skip_unverified in [ False, True ]:
+                with open(os.path.join(os.path.dirname(__file__), 'corpus.json'), 'r') as f:
+                    reader = SimulatedFileReader(Queue(), f, skip_retweets=skip_retweets, skip_unverified=skip_unverified)
+                    f.seek(0)
+                    for line in f:
+                        if reader.valid(json.loads(line)):
+                            self.assertTrue(reader._valid_line(line))
+                            self.assertTrue(reader._valid_line(line.encode()))
@@ -0,0 +1,157 @@
+"""
+Run unit tests on the Twitter package.
+"""
+
+import os
+import sys
+import unittest
+
+from datetime import datetime, timezone
+
+path = os.path.join(os.path.dirname(__file__), '..', '..')
+if path not in sys.path:
+    sys.path.append(path)
+
+from twitter import *
+
+class TestPackage(unittest.TestCase):
+    """
+    Test the functionality of the Twitter package.
+    """
+
+    def test_extract_timestamp_ms(self):
+        """
+        Test that when extracting the timestamp from the ``timestamp_ms`` attribute, the milliseconds are dropped.
+        """
+
+        tweet = { 'timestamp_ms': '1539202764999' }
+        self.assertEqual(1539202764, extract_timestamp(tweet))
+
+    def test_extract_timestamp_ms_rounded(self):
+        """
+        Test that when extracting the timestamp from a ``timestamp_ms`` attribute without milliseconds, the timestamp is unchanged.
+        """
+
+        tweet = { 'timestamp_ms': '1539202764000' }
+        self.assertEqual(1539202764, extract_timestamp(tweet))
+
+    def test_extract_timestamp_created_at(self):
+        """
+        Test that when extracting the timestamp from the ``created_at`` attribute, the timestamp is parsed correctly.
+        """
+
+        tweet = { 'created_at': 'Wed Oct 10 20:19:24 +0000 2018' }
+        self.assertEqual(1539202764, extract_timestamp(tweet))
+
+    def test_extract_timestamp_created_at_timezone(self):
+        """
+        Test that when extracting the timestamp from the ``created_at`` attribute, the timezone is respected.
+        """
+
+        tweet = { 'created_at': 'Wed Oct 10 21:19:24 +0100 2018' }
+        self.assertEqual(1539202764, extract_timestamp(tweet))
+
+    def test_extract_timestamp_prefers_timestamp_ms(self):
+        """
+        Test that when a tweet has both timestamp attributes, the ``timestamp_ms`` attribute is used.
+        """
+
+        tweet = { 'timestamp_ms': '1539202764000', 'created_at': 'Wed Oct 10 20:20:24 +0000 2018' }
+        self.assertEqual(1539202764, extract_timestamp(tweet))
+
+    def test_extract_timestamp_missing(self):
+        """
+        Test that when a tweet has no timestamp attributes, a KeyError is raised.
+        """
+
+        self.assertRaises(KeyError, extract_timestamp, { 'text': 'Hello world!' })
+
+    def test_parse_tweet(self):
+        """
+        Test that parsing a tweet returns its timestamp, its text and that it is not a retweet.
+        """
+
+        tweet = { 'timestamp_ms': '1539202764999', 'text': 'Hello world!' }
+        self.assertEqual((1539202764, 'Hello world!', False), parse_tweet(tweet))
+
+    def test_parse_tweet_extended(self):
+        """
+        Test that parsing a long tweet returns its full text.
+        """
+
+        tweet = { 'timestamp_ms': '1539202764999', 'text': 'Hello…', 'extended_tweet': { 'full_text': 'Hello world!' } }
+        self.assertEqual((1539202764, 'Hello world!', False), parse_tweet(tweet))
+
+    def test_parse_tweet_retweet(self):
+        """
+        Test that parsing a retweet returns the timestamp of the retweet, the full text of the original tweet and that it is a retweet.
+        """
+
+        tweet = { 'timestamp_ms': '1539202764999', 'text': 'RT @user: Hello…',
+                  'retweeted_status': { 'created_at': 'Wed Oct 10 20:00:00 +0000 2018', 'text': 'Hello…',
+                                        'extended_tweet': { 'full_text': 'Hello world!' } } }
+        self.assertEqual((1539202764, 'Hello world!', True), parse_tweet(tweet))
+
+    def test_parse_tweet_equivalent(self):
+        """
+        Test that parsing a tweet returns the same values as extracting them one at a time.
+        """
+
+        tweets = [ { 'timestamp_ms': '1539202764999' },
+                   { 'created_at': 'Wed Oct 10 20:19:24 +0000 2018', 'text': 'Hello world!' },
+                   { 'timestamp_ms': '1539202764999', 'retweeted_status': { 'text': 'Hello world!' } },
+                   { 'timestamp_ms': '1539202764999', 'extended_tweet': { }, 'text': 'Hello world!' } ]
+        for tweet in tweets:
+            self.assertEqual((extract_timestamp(tweet), full_text(tweet), is_retweet(tweet)), parse_tweet(tweet))
+
+    def test_is_verified(self):
+        """
+        Test that a tweet by a verified author is recognized as such.
+        """
+
+        self.assertTrue(is_verified({ 'user': { 'id': 1, 'verified': True } }))
+
+    def test_is_not_verified(self):
+        """
+        Test that a tweet by an unverified author is not recognized as verified.
+        """
+
+        self.assertFalse(is_verified({ 'user': { 'id': 1, 'verified': False } }))
+
+    def test_parse_created_at(self):
+        """
+        Test parsing the ``created_at`` field of a tweet.
+        """
+
+        self.assertEqual(1539202764, parse_created_at('Wed Oct 10 20:19:24 +0000 2018'))
+
+    def test_parse_created_at_positive_offset(self):
+        """
+        Test that when parsing the ``created_at`` field of a tweet with a positive offset, the timestamp is shifted back to UTC.
+        """
+
+        self.assertEqual(1539202764, parse_created_at('Wed Oct 10 21:49:24 +0130 2018'))
+
+    def test_parse_created_at_negative_offset(self):
+        """
+        Test that when parsing the ``created_at`` field of a tweet with a negative offset, the timestamp is shifted forward to UTC.
+        """
+
+        self.assertEqual(1539202764, parse_created_at('Wed Oct 10 18:49:24 -0130 2018'))
+
+    def test_parse_created_at_months(self):
+        """
+        Test that parsing the ``created_at`` field of a tweet recognizes all months.
+        """
+
+        for month, number in MONTHS.items():
+            expected = datetime(2018, number, 10, 20, 19, 24, tzinfo=timezone.utc).timestamp()
+            self.assertEqual(expected, parse_created_at(f"Wed {month} 10 20:19:24 +0000 2018"))
+
+    def test_extract_timestamp_int(self):
+        """
+        Test that the extracted timestamp is an integer, regardless of where it is extracted from.
+        """
+
+        self.assertEqual(int, type(extract_timestamp({ 'timestamp_ms': '1539202764999' })))
+        self.assertEqual(int, type(extract_timestamp({ 'created_at': 'Wed Oct 10 20:19:24 +0000 2018' })))
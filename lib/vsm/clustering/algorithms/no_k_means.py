@@ -22,6 +22,7 @@ Frozen clusters cannot receive new vectors, and thus the algorithm can skip many
     The concept of one-pass incremental algorithms is very general, however, so you will find approaches like this one elsewhere.
 """
 
+import operator
 import os
 import sys
 
@@ -108,24 +109,35 @@ class NoKMeans(ClusteringAlgorithm):
             """
             Freeze inactive clusters first.
             In this way, nothing gets added to them, thereby resetting their age.
+
+            The algorithm goes through the active clusters once for each vector.
+            It updates each cluster's age, and if the cluster is still active, it compares it with the vector.
+            All inactive clusters are frozen together after the ages of all active clusters are updated.
             """
+            frozen, closest, closest_similarity = [ ], None, None
             for cluster in self.clusters:
                 self._update_age(cluster)
                 if self._to_freeze(cluster):
-                    self._freeze(cluster)
+                    frozen.append(cluster)
+                    continue
+
+                similarity = cluster.similarity(vector, *args, **kwargs)
+                if closest is None or similarity > closest_similarity:
+                    closest, closest_similarity = cluster, similarity
+
+            if frozen:
+                self._freeze(*frozen)
 
             """
-            If there are active clusters, get the closest cluster.
+            If there are active clusters, take the closest cluster.
             If the vector's similarity with the cluster exceeds the threshold, add the vector to the cluster.
             The cluster's age is resetted.
             """
-            if self.clusters:
-                cluster, similarity = self._closest_cluster(vector, *args, **kwargs)
-                if similarity >= self.threshold:
-                    cluster.vectors.append(vector)
-                    self._reset_age(cluster)
-                    updated_clusters.append(cluster)
-                    continue
+            if closest is not None and closest_similarity >= self.threshold:
+                closest.add_vector(vector)
+                self._reset_age(closest)
+                updated_clusters.append(closest)
+                continue
 
             """
             If there was no similar cluster, create a new cluster with just that vector.
@@ -134,7 +146,10 @@ class NoKMeans(ClusteringAlgorithm):
             self.clusters.append(cluster)
             updated_clusters.append(cluster)
 
-        return list(set(updated_clusters))
+        """
+        Each cluster is returned once, in the order in which it first received a vector.
+        """
+        return list(dict.fromkeys(updated_clusters))
 
     def _update_age(self, cluster, increment=1):
         """
@@ -162,22 +177,33 @@ class NoKMeans(ClusteringAlgorithm):
 
         return cluster.attributes.get('age') > self.freeze_period
 
-    def _freeze(self, cluster):
+    def _freeze(self, *clusters):
         """
-        Freeze the given cluster.
-        This removes the cluster from the list of active clusters.
-        Simultaneously, it is added to the list of frozen clusters.
+        Freeze the given clusters.
+        This removes the clusters from the list of active clusters.
+        Simultaneously, they are added to the list of frozen clusters.
 
-        :param cluster: The cluster whose age will be incremented.
-        :type cluster: :class:`~vsm.clustering.cluster.Cluster`
+        The clusters should be given as arguments.
+        The list of active clusters is rebuilt once, no matter how many clusters are frozen.
+        Frozen clusters do not change anymore, so they are also compacted to free up the memory that they only need to add vectors.
+
+        :param clusters: The clusters to freeze.
+        :type clusters: :class:`~vsm.clustering.cluster.Cluster`
 
-        :raises ValueError: When the cluster is not active.
+        :raises ValueError: When any of the clusters is not active.
         """
 
-        self.clusters.remove(cluster)
+        frozen = set(clusters)
+        active = [ cluster for cluster in self.clusters if cluster not in frozen ]
+        if len(self.clusters) - len(active) != len(clusters):
+            raise ValueError("Only active clusters can be frozen")
+
+        self.clusters[:] = active
+        for cluster in clusters:
+            cluster.compact()
 
         if self.store_frozen:
-            self.frozen_clusters.append(cluster)
+            self.frozen_clusters.extend(clusters)
 
     def _closest_cluster(self, vector, *args, **kwargs):
         """
@@ -196,9 +222,12 @@ class NoKMeans(ClusteringAlgorithm):
         if not self.clusters:
             return None
 
-        similarities = [ (cluster, cluster.similarity(vector, *args, **kwargs)) for cluster in self.clusters ]
-        closest_cluster = sorted(similarities, key=lambda tuple: tuple[1], reverse=True)[0]
-        return closest_cluster
+        """
+        Only the closest cluster is needed, so the similarities are not sorted.
+        If more than one cluster has the highest similarity, the first one is returned.
+        """
+        similarities = ( (cluster, cluster.similarity(vector, *args, **kwargs)) for cluster in self.clusters )
+        return max(similarities, key=operator.itemgetter(1))
 
     def _reset_age(self, cluster):
         """
@@ -5,6 +5,7 @@ Instead, it is based on the time that has elapsed since a cluster last received
 In other words, it's possible that the algorithm freezes a cluster because a lot of time has passed since it was active, even if it has received no new vectors!
 """
 
+import operator
 import os
 import sys
 
@@ -66,22 +67,27 @@ class TemporalNoKMeans(NoKMeans):
 
         """
         Vectors are clustered chronologically.
+        Each vector's timestamp is looked up once and kept alongside the vector.
         """
         latest = -1
-        vectors = sorted(vectors, key=lambda vector: vector.attributes.get(time))
-        for vector in vectors:
-            timestamp = vector.attributes.get(time)
+        vectors = sorted(( (vector.attributes.get(time), vector) for vector in vectors ), key=operator.itemgetter(0))
+        for timestamp, vector in vectors:
 
             """
             Freeze inactive clusters first.
             In this way, nothing gets added to them, thereby resetting their age.
             Skip this step if the next vector is not newer than the previous vector.
+
+            The ages of all active clusters are updated before any cluster is frozen.
+            Freezing a cluster removes it from the active clusters, so freezing clusters while updating the ages would skip the cluster after each frozen one.
             """
             if latest < timestamp:
                 for cluster in self.clusters:
                     self._update_age(cluster, timestamp, time)
-                    if self._to_freeze(cluster):
-                        self._freeze(cluster)
+
+                frozen = [ cluster for cluster in self.clusters if self._to_freeze(cluster) ]
+                if frozen:
+                    self._freeze(*frozen)
                 latest = timestamp
 
             """
@@ -92,7 +98,7 @@ class TemporalNoKMeans(NoKMeans):
             if self.clusters:
                 cluster, similarity = self._closest_cluster(vector, *args, **kwargs)
                 if similarity >= self.threshold:
-                    cluster.vectors.append(vector)
+                    cluster.add_vector(vector)
                     self._reset_age(cluster)
                     updated_clusters.append(cluster)
                     continue
@@ -104,7 +110,10 @@ class TemporalNoKMeans(NoKMeans):
             self.clusters.append(cluster)
             updated_clusters.append(cluster)
 
-        return list(set(updated_clusters))
+        """
+        Each cluster is returned once, in the order in which it first received a vector.
+        """
+        return list(dict.fromkeys(updated_clusters))
 
     def _update_age(self, cluster, timestamp, time):
         """
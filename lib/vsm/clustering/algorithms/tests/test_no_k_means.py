@@ -12,6 +12,7 @@ if path not in sys.path:
     sys.path.append(path)
 
 from nlp.document import Document
+from vsm import vector_math
 from vsm.clustering.cluster import Cluster
 from vsm.clustering.algorithms.no_k_means import NoKMeans
 
@@ -141,6 +142,52 @@ class TestNoKMeans(unittest.TestCase):
         self.assertFalse(cluster in algo.clusters)
         self.assertTrue(cluster in algo.frozen_clusters)
 
+    def test_freeze_several(self):
+        """
+        Test that several clusters can be frozen together, and that the other clusters remain active in the same order.
+        """
+
+        clusters = [ Cluster() for i in range(5) ]
+        algo = NoKMeans(0.5, 10, store_frozen=True)
+        algo.clusters.extend(clusters)
+        algo._freeze(clusters[1], clusters[3])
+        self.assertEqual([ clusters[0], clusters[2], clusters[4] ], algo.clusters)
+        self.assertEqual([ clusters[1], clusters[3] ], algo.frozen_clusters)
+
+    def test_freeze_several_with_inactive(self):
+        """
+        Test that when freezing several clusters, one of which is not active, the function raises a ValueError and no cluster is frozen.
+        """
+
+        clusters = [ Cluster() for i in range(3) ]
+        algo = NoKMeans(0.5, 10, store_frozen=True)
+        algo.clusters.extend(clusters[:2])
+        self.assertRaises(ValueError, algo._freeze, clusters[0], clusters[2])
+        self.assertEqual(clusters[:2], algo.clusters)
+        self.assertEqual([ ], algo.frozen_clusters)
+
+    def test_cluster_freeze_ages_next_cluster(self):
+        """
+        Test that when a cluster is frozen, the next active cluster still ages.
+        """
+
+        algo = NoKMeans(0.5, 1, store_frozen=True)
+
+        """
+        Create the test data.
+        """
+        documents = [
+            Document('', [ 'x', 'y' ]), Document('', [ 'p', 'q' ]),
+            Document('', [ 'a', 'b', 'a', 'c' ]), Document('', [ 'a', 'b', 'a' ]),
+        ]
+        for document in documents:
+            document.normalize()
+
+        clusters = algo.cluster(documents)
+        self.assertEqual(3, len(clusters))
+        self.assertEqual(1, len(algo.clusters))
+        self.assertEqual(2, len(algo.frozen_clusters))
+
     def test_reset_age_without_previous(self):
         """
         Test that when resetting the age of a cluster that has no age, the age is set to 0.
@@ -229,6 +276,34 @@ class TestNoKMeans(unittest.TestCase):
         self.assertEqual(c1, closest_cluster)
         self.assertGreater(similarity, 0)
 
+    def test_closest_cluster_tie(self):
+        """
+        Test that when two clusters are equally close, the first one is returned.
+        """
+
+        algo = NoKMeans(0.5, 10, store_frozen=True)
+
+        """
+        Create the test data.
+        """
+        documents = [ Document('', [ 'a', 'b' ]), Document('', [ 'a', 'b' ]) ]
+        for document in documents:
+            document.normalize()
+
+        c1 = Cluster(documents[:1])
+        c2 = Cluster(documents[1:])
+        algo.clusters = [ c1, c2 ]
+
+        document = Document('', [ 'a', 'b' ])
+        document.normalize()
+        closest_cluster, similarity = algo._closest_cluster(document)
+        self.assertEqual(c1, closest_cluster)
+        self.assertEqual(round(similarity, 10), 1)
+
+        algo.clusters = [ c2, c1 ]
+        closest_cluster, similarity = algo._closest_cluster(document)
+        self.assertEqual(c2, closest_cluster)
+
     def test_cluster_freeze(self):
         """
         Test that when there is a shift in discourse, old clusters are frozen.
@@ -275,6 +350,28 @@ class TestNoKMeans(unittest.TestCase):
         self.assertTrue(all('a' in document.dimensions for document in cluster_a.vectors))
         self.assertTrue(all('x' in document.dimensions for document in cluster_x.vectors))
 
+    def test_cluster_return_order(self):
+        """
+        Test that the updated clusters are returned once each, in the order in which they first received a vector.
+        """
+
+        algo = NoKMeans(0.5, 10, store_frozen=True)
+
+        """
+        Create the test data.
+        """
+        documents = [
+            Document('', [ 'x', 'y' ]),
+            Document('', [ 'a', 'b', 'a', 'c' ]), Document('', [ 'x', 'y', 'x' ]), Document('', [ 'a', 'b', 'a' ]),
+        ]
+        for document in documents:
+            document.normalize()
+
+        clusters = algo.cluster(documents)
+        self.assertEqual(2, len(clusters))
+        self.assertEqual(documents[0::2], clusters[0].vectors)
+        self.assertEqual(documents[1::2], clusters[1].vectors)
+
     def test_cluster_retun_only_updated(self):
         """
         Test that updated clusters are not returned.
@@ -344,3 +441,52 @@ class TestNoKMeans(unittest.TestCase):
         self.assertEqual(active, algo.clusters)
         self.assertEqual(1, len(algo.clusters))
         self.assertEqual([ ], algo.frozen_clusters)
+
+    def test_cluster_over_several_calls(self):
+        """
+        Test that when clustering vectors over several calls, the centroids of the clusters that grow stay correct.
+        """
+
+        algo = NoKMeans(0.5, 10)
+
+        """
+        Create the test data.
+        """
+        documents = [
+            Document('', [ 'a', 'b', 'a', 'c' ]), Document('', [ 'a', 'b', 'a' ]),
+            Document('', [ 'a', 'b' ]), Document('', [ 'a', 'c', 'a' ]),
+        ]
+        for document in documents:
+            document.normalize()
+
+        algo.cluster(documents[:2])
+        algo.cluster(documents[2:])
+        self.assertEqual(1, len(algo.clusters))
+        cluster = algo.clusters[0]
+        self.assertEqual(documents, cluster.vectors)
+        expected = vector_math.normalize(vector_math.concatenate(documents)).dimensions
+        self.assertEqual(set(expected), set(cluster.centroid.dimensions))
+        self.assertTrue(all(round(expected[dimension], 10) == round(cluster.centroid.dimensions[dimension], 10)
+                            for dimension in expected))
+
+    def test_freeze_keeps_centroid(self):
+        """
+        Test that freezing a cluster keeps its centroid, and that the centroid stays correct if the cluster grows afterwards.
+        """
+
+        algo = NoKMeans(0.5, 10, store_frozen=True)
+        documents = [ Document('', [ 'a', 'b' ]), Document('', [ 'a', 'c' ]) ]
+        cluster = Cluster(documents[0])
+        centroid = cluster.centroid
+        algo.clusters.append(cluster)
+        algo._freeze(cluster)
+        self.assertTrue(centroid is cluster.centroid)
+
+        """
+        Adding a vector to a compacted cluster still gives the correct centroid.
+        """
+        cluster.add_vector(documents[1])
+        expected = vector_math.normalize(vector_math.concatenate(documents)).dimensions
+        self.assertEqual(set(expected), set(cluster.centroid.dimensions))
+        self.assertTrue(all(round(expected[dimension], 10) == round(cluster.centroid.dimensions[dimension], 10)
+                            for dimension in expected))
@@ -94,6 +94,30 @@ class TestNoKMeans(unittest.TestCase):
         self.assertEqual(1, len(algo.clusters))
         self.assertEqual(1, len(algo.frozen_clusters))
 
+    def test_cluster_freeze_several(self):
+        """
+        Test that when several clusters become inactive at the same time, they are all frozen.
+        """
+
+        algo = TemporalNoKMeans(0.5, 2, store_frozen=True)
+
+        """
+        Create the test data.
+        """
+        documents = [
+            Document('', [ 'x', 'y' ], attributes={ 'timestamp': 1 }),
+            Document('', [ 'p', 'q' ], attributes={ 'timestamp': 2 }),
+            Document('', [ 'a', 'b', 'a', 'c' ], attributes={ 'timestamp': 10 }),
+        ]
+        for document in documents:
+            document.normalize()
+
+        clusters = algo.cluster(documents)
+        self.assertEqual(3, len(clusters))
+        self.assertEqual(1, len(algo.clusters))
+        self.assertEqual(2, len(algo.frozen_clusters))
+        self.assertTrue('a' in algo.clusters[0].centroid.dimensions)
+
     def test_cluster_similar_vectors(self):
         """
         Test that similar vectors cluster together.
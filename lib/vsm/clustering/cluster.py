@@ -9,7 +9,11 @@ To achieve this goal, good clusters:
 Although you can create a :class:`~vsm.clustering.cluster.Cluster` instance yourself, it is more common to generate clusters automatically using a :class:`~vsm.clustering.algorithms.clustering.ClusteringAlgorithm`.
 """
 
+import heapq
 import importlib
+import itertools
+import math
+import operator
 import os
 import sys
 
@@ -22,6 +26,74 @@ from objects.exportable import Exportable
 
 from vsm import Vector, vector_math
 
+class VectorList(list):
+    """
+    The :class:`~vsm.clustering.cluster.VectorList` is the ``list`` that stores a :class:`~vsm.clustering.cluster.Cluster`'s vectors.
+    It behaves exactly like a normal ``list``, but it also keeps a version number that changes every time that the list changes.
+    The list also :func:`watches <vsm.vector.VectorSpace.watch>` the dimensions of its vectors, which increase the version when they change.
+    The :class:`~vsm.clustering.cluster.Cluster` uses this version to know when its centroid needs to be re-calculated without comparing all of its vectors.
+
+    :ivar version: The version of the list, which increases every time that the list or the dimensions of its vectors change.
+    :vartype version: int
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create the list with a version of 0.
+        The arguments and keyword arguments are passed on to the ``list`` constructor.
+        """
+
+        super(VectorList, self).__init__(*args, **kwargs)
+        self.version = 0
+
+    def append(self, *args, **kwargs):
+        super(VectorList, self).append(*args, **kwargs)
+        self.version += 1
+
+    def extend(self, *args, **kwargs):
+        super(VectorList, self).extend(*args, **kwargs)
+        self.version += 1
+
+    def insert(self, *args, **kwargs):
+        super(VectorList, self).insert(*args, **kwargs)
+        self.version += 1
+
+    def remove(self, *args, **kwargs):
+        super(VectorList, self).remove(*args, **kwargs)
+        self.version += 1
+
+    def pop(self, *args, **kwargs):
+        self.version += 1
+        return super(VectorList, self).pop(*args, **kwargs)
+
+    def clear(self, *args, **kwargs):
+        super(VectorList, self).clear(*args, **kwargs)
+        self.version += 1
+
+    def sort(self, *args, **kwargs):
+        super(VectorList, self).sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self, *args, **kwargs):
+        super(VectorList, self).reverse(*args, **kwargs)
+        self.version += 1
+
+    def __setitem__(self, *args, **kwargs):
+        super(VectorList, self).__setitem__(*args, **kwargs)
+        self.version += 1
+
+    def __delitem__(self, *args, **kwargs):
+        super(VectorList, self).__delitem__(*args, **kwargs)
+        self.version += 1
+
+    def __iadd__(self, *args, **kwargs):
+        self.version += 1
+        return super(VectorList, self).__iadd__(*args, **kwargs)
+
+    def __imul__(self, *args, **kwargs):
+        self.version += 1
+        return super(VectorList, self).__imul__(*args, **kwargs)
+
 class Cluster(Attributable, Exportable):
     """
     The :class:`~vsm.clustering.cluster.Cluster` class is a collection of :class:`~vsm.vector.Vector` instances, or inherited classes, like :class:`~nlp.document.Document`.
@@ -31,6 +103,9 @@ class Cluster(Attributable, Exportable):
     The :class:`~vsm.clustering.cluster.Cluster` also has a special property: ``centroid``.
     The centroid is a :class:`~vsm.vector.Vector` that represents the cluster's general direction.
     It is calculated as an average over all the dimensions of the :class:`~vsm.vector.Vector` instances making up the cluster.
+    The cluster keeps a running sum of its vectors for this purpose.
+    Adding vectors with :func:`~vsm.clustering.cluster.Cluster.add_vector` keeps this sum up-to-date, even across many clustering calls.
+    Any other change to the ``vectors``, such as removing vectors or replacing the list, means that the sum is re-calculated from all of the vectors the next time that the centroid is needed.
 
     Clusters are based on the :class:`~objects.attributable.Attributable` class so they may have additional properties.
 
@@ -38,9 +113,16 @@ class Cluster(Attributable, Exportable):
     :vartype vectors: list of :class:`~vsm.vector.Vector`
     :ivar centroid: The centroid of the cluster, representing the average vector in the cluster.
     :vartype centroid: :class:`~vsm.vector.Vector`
-    :ivar _last: A snapshot of the cluster the last time that its centroid was re-calculated.
-                 This variable is used so that the centroid is not re-calculated needlessly if the cluster's vector has not changed.
-    :vartype _last: dict
+    :ivar _sum: The sum of the vectors along each dimension.
+                The cluster keeps this sum so that it can update the centroid without going through all of its vectors when a new vector is added.
+    :vartype _sum: dict
+    :ivar _sum_version: The version of the list of vectors that the sum represents.
+                        If it is ``None``, the sum is re-calculated the next time that the centroid is requested.
+    :vartype _sum_version: int or None
+    :ivar _centroid_version: The version of the list of vectors the last time that the centroid was re-calculated.
+                             This variable is used so that the centroid is not re-calculated needlessly if the cluster's vectors have not changed.
+                             If it is ``None``, the centroid is re-calculated the next time that it is requested.
+    :vartype _centroid_version: int or None
     """
 
     def __init__(self, vectors=None, *args, **kwargs):
@@ -48,14 +130,14 @@ class Cluster(Attributable, Exportable):
         Initialize the cluster with an empty centroid and a list of vectors.
 
         :param vectors: An initial list of vectors, or a single vector.
+                        The vectors can also be given as any other iterable, such as a tuple or a generator.
                         If ``None`` is given, an empty list is initialized instead.
-        :type vectors: list of :class:`~vsm.vector.Vector` or :class:`~vsm.vector.Vector` or ``None``
+        :type vectors: iterable of :class:`~vsm.vector.Vector` or :class:`~vsm.vector.Vector` or ``None``
         """
 
         super(Cluster, self).__init__(*args, **kwargs)
         self.vectors = vectors
         self.centroid = Vector()
-        self._last = None
 
     def similarity(self, vector, similarity_measure=vector_math.cosine):
         """
@@ -74,6 +156,69 @@ class Cluster(Attributable, Exportable):
 
         return similarity_measure(self.centroid, vector)
 
+    def similarities(self, vectors, similarity_measure=vector_math.cosine):
+        """
+        Calculate the similarity between each of the given vectors and this cluster's centroid.
+        The result is the same as calling :func:`~vsm.clustering.cluster.Cluster.similarity` with each vector.
+        However, the centroid is fetched only once, which makes this function faster when comparing many vectors with the cluster.
+        With the cosine similarity, the centroid's magnitude is also looked up only once.
+
+        :param vectors: The vectors that will be compared with the centroid.
+        :type vectors: list of :class:`~vsm.vector.Vector`
+        :param similarity_measure: The similarity function to use to compare the likeliness of the vectors with the cluster.
+        :type similarity_measure: func
+
+        :return: The similarity between the cluster and each vector, in the same order as the given vectors.
+        :rtype: list of float
+        """
+
+        centroid = self.centroid
+        if similarity_measure is vector_math.cosine:
+            magnitude = vector_math.magnitude(centroid)
+            return [ vector_math.cosine(centroid, vector, magnitude) for vector in vectors ]
+
+        return [ similarity_measure(centroid, vector) for vector in vectors ]
+
+    def add_vector(self, vector):
+        """
+        Add the given vector to the cluster.
+        Adding a vector using this function is equivalent to appending it to the ``vectors``.
+        However, this function also adds the vector to the cluster's running sum, so the centroid does not need to be re-calculated from all of the vectors.
+
+        :param vector: The vector to add to the cluster.
+        :type vector: :class:`~vsm.vector.Vector`
+        """
+
+        vectors = self.__vectors
+
+        """
+        The running sum can only be updated if it represents all of the vectors already in the cluster.
+        Otherwise, the sum is re-calculated from all of the vectors the next time that the centroid is requested.
+        """
+        if self._sum_version == vectors.version:
+            sums = self._sum
+            get = sums.get
+            for dimension, magnitude in vector.dimensions.items():
+                sums[dimension] = get(dimension, 0) + magnitude
+
+            vectors.append(vector)
+            vector.dimensions.watch(vectors)
+            self._sum_version = vectors.version
+        else:
+            vectors.append(vector)
+
+    def compact(self):
+        """
+        Discard the running sum of the vectors to free up memory.
+        The cluster only needs the running sum to update the centroid quickly when new vectors are added.
+        Therefore it is safe to compact clusters that are not expected to change anymore, such as frozen clusters.
+
+        The centroid remains cached, so compacting the cluster does not re-calculate it.
+        If the cluster changes later, the running sum is re-calculated from all of the vectors.
+        """
+
+        self._sum, self._sum_version = { }, None
+
     def recalculate_centroid(self):
         """
         Recalculate the centroid.
@@ -94,13 +239,44 @@ class Cluster(Attributable, Exportable):
             This function is invoked automatically when you fetch the centroid.
         """
 
-        centroid = { }
-        for vector in self.vectors:
-            for dimension, magnitude in vector.dimensions.items():
-                centroid[dimension] = centroid.get(dimension, 0) + magnitude / len(self.vectors)
+        """
+        Sum the magnitudes along each dimension first, and divide the sums by the number of vectors only once at the end.
+        The sums are kept so that vectors added with :func:`~vsm.clustering.cluster.Cluster.add_vector` only need to be added to them.
+        The list of vectors watches the dimensions that make up the sum, so that any change to them changes the list's version.
+        """
+        vectors = self.__vectors
+        sums = { }
+        get = sums.get
+        for vector in vectors:
+            dimensions = vector.dimensions
+            dimensions.watch(vectors)
+            for dimension, magnitude in dimensions.items():
+                sums[dimension] = get(dimension, 0) + magnitude
+
+        self._sum, self._sum_version = sums, vectors.version
+        self._update_centroid()
+
+    def _update_centroid(self):
+        """
+        Update the centroid from the running sum of the vectors.
+        The function divides the sum along each dimension by the number of vectors and normalizes the centroid.
+        """
+
+        vectors = self.__vectors
+        size = len(vectors)
+        centroid = { dimension: magnitude / size for dimension, magnitude in self._sum.items() }
+
+        """
+        Normalize the centroid directly instead of using :func:`~vsm.vector.Vector.normalize`, which copies the dimensions several times.
+        The arithmetic is the same as in :func:`~vsm.vector_math.normalize`.
+        """
+        values = centroid.values()
+        norm = math.sqrt(sum(map(operator.mul, values, values)))
+        if norm > 0:
+            centroid = { dimension: value / norm for dimension, value in centroid.items() }
 
         self.__centroid = Vector(centroid)
-        self.__centroid.normalize()
+        self._centroid_version = vectors.version
 
     @property
     def centroid(self):
@@ -112,10 +288,17 @@ class Cluster(Attributable, Exportable):
         :rtype: :class:`~vsm.vector.Vector`
         """
 
-        current = self.to_array()
-        if not self._last or self._last != current:
-            self._last = current
-            self.recalculate_centroid()
+        """
+        The centroid only changes if the list of vectors or their dimensions changed, both of which change the list's version.
+        If the list only changed because new vectors were added with :func:`~vsm.clustering.cluster.Cluster.add_vector`, the centroid can be updated from the running sum.
+        Otherwise, it is re-calculated from all of the vectors.
+        """
+        vectors = self.__vectors
+        if self._centroid_version != vectors.version:
+            if self._sum_version == vectors.version:
+                self._update_centroid()
+            else:
+                self.recalculate_centroid()
 
         return self.__centroid
 
@@ -147,15 +330,19 @@ class Cluster(Attributable, Exportable):
         Override the vectors.
 
         :param vectors: The new vectors.
-        :type vectors: list of :class:`~vsm.vector.Vector` or :class:`~vsm.vector.Vector` or None
+                        The vectors can be given as any iterable, such as a list, a tuple or a generator, and they are copied into a new list.
+        :type vectors: iterable of :class:`~vsm.vector.Vector` or :class:`~vsm.vector.Vector` or None
         """
 
         if vectors is None:
-            self.__vectors = [ ]
-        elif type(vectors) is list:
-            self.__vectors = list(vectors)
+            self.__vectors = VectorList()
+        elif isinstance(vectors, Vector):
+            self.__vectors = VectorList([ vectors ])
         else:
-            self.__vectors = [ vectors ]
+            self.__vectors = VectorList(vectors)
+
+        self._sum, self._sum_version = { }, None
+        self._centroid_version = None
 
     def get_representative_vectors(self, vectors=1, similarity_measure=vector_math.cosine):
         """
@@ -176,22 +363,22 @@ class Cluster(Attributable, Exportable):
 
         """
         First calculate all the similarities between the centroid and each vector in the cluster.
-        Then, rank all vectors by their similarity score.
+        Then, pick the vectors with the highest similarity scores without sorting all of the vectors.
+        When two vectors have the same score, the one that was added to the cluster later is ranked first.
         """
 
-        similarities = [ self.similarity(vector, similarity_measure) for vector in self.vectors ]
-        similarities = zip(self.vectors, similarities)
-        similarities = sorted(similarities, key=lambda x:x[1])[::-1]
+        similarities = self.similarities(self.vectors, similarity_measure)
+        similarities = zip(similarities, itertools.count(), self.vectors)
 
         """
         If only one vector is needed, just return the vector, not a list of vectors.
         Otherwise return a list.
         """
         if vectors == 1:
-            return similarities[0][0] if len(similarities) else None
+            closest = max(similarities, default=None)
+            return closest[2] if closest else None
         else:
-            similarities = similarities[:vectors]
-            return [ similarity[0] for similarity in similarities ]
+            return [ similarity[2] for similarity in heapq.nlargest(vectors, similarities) ]
 
     def get_intra_similarity(self, similarity_measure=vector_math.cosine):
         """
@@ -210,8 +397,7 @@ class Cluster(Attributable, Exportable):
         """
 
         if self.vectors:
-            centroid = self.centroid
-            similarities = [ similarity_measure(centroid, vector) for vector in self.vectors ]
+            similarities = self.similarities(self.vectors, similarity_measure)
             return sum(similarities)/len(similarities)
 
         return 0
@@ -253,10 +439,15 @@ class Cluster(Attributable, Exportable):
         :rtype: :class:`~vsm.clustering.cluster.Cluster`
         """
 
-        vectors = [ ]
+        """
+        Clusters are usually made up of vectors of the same class, so each class is looked up only once.
+        """
+        vectors, classes = [ ], { }
         for vector in array.get('vectors'):
-            module = importlib.import_module(Exportable.get_module(vector.get('class')))
-            cls = getattr(module, Exportable.get_class(vector.get('class')))
-            vectors.append(cls.from_array(vector))
+            name = vector.get('class')
+            if name not in classes:
+                module = importlib.import_module(Exportable.get_module(name))
+                classes[name] = getattr(module, Exportable.get_class(name))
+            vectors.append(classes[name].from_array(vector))
 
         return Cluster(vectors=vectors, attributes=array.get('attributes'))
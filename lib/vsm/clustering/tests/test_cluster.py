@@ -144,6 +144,25 @@ class TestCluster(unittest.TestCase):
         c.vectors.remove(v[1])
         self.assertEqual(round(3/(math.sqrt(2) * math.sqrt(2**2 + 1 + 1)), 5), round(c.similarity(n), 5))
 
+    def test_cluster_similarities(self):
+        """
+        Test that calculating the similarity between a cluster and several vectors is the same as calculating them one at a time.
+        """
+
+        c = Cluster([ Vector({ 'a': 1, 'b': 2 }), Vector({ 'a': 1 }) ])
+        v = [ Vector({ 'a': 1 }), Vector({ 'c': 1 }), Vector(), Vector({ 'a': 1, 'b': 1, 'c': 1 }) ]
+        self.assertEqual([ c.similarity(vector) for vector in v ], c.similarities(v))
+        self.assertEqual([ c.similarity(vector, vector_math.euclidean) for vector in v ],
+                         c.similarities(v, vector_math.euclidean))
+
+    def test_cluster_similarities_empty(self):
+        """
+        Test that calculating the similarity between a cluster and no vectors returns an empty list.
+        """
+
+        c = Cluster([ Vector({ 'a': 1, 'b': 2 }) ])
+        self.assertEqual([ ], c.similarities([ ]))
+
     def test_empty_cluster_similarity(self):
         """
         Test that when calculating the similarity between a vector and an empty cluster, the similarity is 0.
@@ -205,6 +224,175 @@ class TestCluster(unittest.TestCase):
         self.assertEqual(round(0.5/math.sqrt(1 ** 2 + 0.5 ** 2), 10), round(c.centroid.dimensions['b'], 10))
         self.assertEqual(1, round(vector_math.magnitude(c.centroid), 10))
 
+    def test_centroid_cached(self):
+        """
+        Test that when the vectors do not change, the centroid is not re-calculated.
+        """
+
+        c = Cluster([ Vector({ 'a': 1 }), Vector({ 'b': 1 }) ])
+        centroid = c.centroid
+        self.assertTrue(centroid is c.centroid)
+
+    def test_centroid_cached_after_other_vector_changes(self):
+        """
+        Test that when a vector outside of the cluster is given new dimensions, the centroid is not re-calculated.
+        """
+
+        c = Cluster([ Vector({ 'a': 1 }), Vector({ 'b': 1 }) ])
+        centroid = c.centroid
+        Vector({ 'a': 1 }).normalize()
+        self.assertTrue(centroid is c.centroid)
+
+    def test_centroid_after_dimensions_change_in_place(self):
+        """
+        Test that the centroid is re-calculated after the dimensions of a vector in the cluster change in place.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'b': 1 }) ]
+        c = Cluster(v)
+        self.assertEqual({ 'a', 'b' }, set(c.centroid.dimensions))
+
+        v[0].dimensions['c'] = 2
+        expected = vector_math.normalize(vector_math.concatenate(v))
+        self.assertEqual({ 'a', 'b', 'c' }, set(c.centroid.dimensions))
+        self.assertEqual({ dimension: round(value, 10) for dimension, value in expected.dimensions.items() },
+                         { dimension: round(value, 10) for dimension, value in c.centroid.dimensions.items() })
+
+        del v[1].dimensions['b']
+        self.assertEqual({ 'a', 'c' }, set(c.centroid.dimensions))
+
+    def test_centroid_after_removed_vector_changes(self):
+        """
+        Test that changing a vector after removing it from the cluster does not change the centroid.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'b': 1 }) ]
+        c = Cluster(v)
+        c.centroid
+        c.vectors.remove(v[1])
+        self.assertEqual({ 'a': 1 }, c.centroid.dimensions)
+        v[1].dimensions['a'] = 1
+        v[1].dimensions = { 'c': 1 }
+        self.assertEqual({ 'a': 1 }, c.centroid.dimensions)
+
+    def test_centroid_after_list_changes(self):
+        """
+        Test that the centroid is re-calculated after any change to the list of vectors.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'b': 1 }), Vector({ 'c': 1 }) ]
+        c = Cluster(v[:2])
+        self.assertEqual({ 'a', 'b' }, set(c.centroid.dimensions))
+
+        c.vectors[1] = v[2]
+        self.assertEqual({ 'a', 'c' }, set(c.centroid.dimensions))
+
+        c.vectors += [ v[1] ]
+        self.assertEqual({ 'a', 'b', 'c' }, set(c.centroid.dimensions))
+
+        del c.vectors[0]
+        self.assertEqual({ 'b', 'c' }, set(c.centroid.dimensions))
+
+        c.vectors.pop()
+        self.assertEqual({ 'c' }, set(c.centroid.dimensions))
+
+        c.vectors.clear()
+        self.assertEqual({ }, c.centroid.dimensions)
+
+    def test_add_vector(self):
+        """
+        Test that adding vectors one at a time gives the same centroid as creating the cluster with all of the vectors.
+        """
+
+        v = [ Vector({ 'a': 1, 'b': 2 }), Vector({ 'a': 3 }), Vector({ 'c': 1 }) ]
+        c = Cluster(v[0])
+        c.centroid
+        c.add_vector(v[1])
+        expected = vector_math.normalize(vector_math.concatenate(v[:2]))
+        self.assertEqual({ dimension: round(value, 10) for dimension, value in expected.dimensions.items() },
+                         { dimension: round(value, 10) for dimension, value in c.centroid.dimensions.items() })
+
+        c.add_vector(v[2])
+        self.assertEqual(v, c.vectors)
+        self.assertEqual(Cluster(v).centroid.dimensions, c.centroid.dimensions)
+
+    def test_add_vector_after_append(self):
+        """
+        Test that adding a vector after appending vectors directly to the list still gives the correct centroid.
+        """
+
+        v = [ Vector({ 'a': 1, 'b': 2 }), Vector({ 'a': 3 }), Vector({ 'c': 1 }) ]
+        c = Cluster(v[0])
+        c.centroid
+        c.vectors.append(v[1])
+        c.add_vector(v[2])
+        self.assertEqual(v, c.vectors)
+        self.assertEqual(Cluster(v).centroid.dimensions, c.centroid.dimensions)
+
+    def test_add_vector_after_dimensions_change(self):
+        """
+        Test that adding a vector after changing the dimensions of a vector in the cluster still gives the correct centroid.
+        """
+
+        v = [ Vector({ 'a': 1, 'b': 2 }), Vector({ 'a': 3 }) ]
+        c = Cluster(v[0])
+        c.centroid
+        v[0].dimensions = { 'c': 1 }
+        c.add_vector(v[1])
+        self.assertEqual({ 'a', 'c' }, set(c.centroid.dimensions))
+        self.assertEqual(Cluster(v).centroid.dimensions, c.centroid.dimensions)
+        expected = vector_math.normalize(vector_math.concatenate(v))
+        self.assertEqual({ dimension: round(value, 10) for dimension, value in expected.dimensions.items() },
+                         { dimension: round(value, 10) for dimension, value in c.centroid.dimensions.items() })
+
+    def test_compact(self):
+        """
+        Test that compacting a cluster discards the running sum but keeps the centroid.
+        """
+
+        v = [ Vector({ 'a': 1, 'b': 2 }), Vector({ 'a': 3 }) ]
+        c = Cluster(v)
+        centroid = c.centroid
+        c.compact()
+        self.assertTrue(centroid is c.centroid)
+        expected = vector_math.normalize(vector_math.concatenate(v))
+        self.assertEqual({ dimension: round(value, 10) for dimension, value in expected.dimensions.items() },
+                         { dimension: round(value, 10) for dimension, value in c.centroid.dimensions.items() })
+
+    def test_add_vector_after_compact(self):
+        """
+        Test that adding a vector to a compacted cluster still gives the correct centroid.
+        """
+
+        v = [ Vector({ 'a': 1, 'b': 2 }), Vector({ 'a': 3 }), Vector({ 'c': 1 }) ]
+        c = Cluster(v[:2])
+        c.centroid
+        c.compact()
+        c.add_vector(v[2])
+        self.assertEqual(Cluster(v).centroid.dimensions, c.centroid.dimensions)
+
+    def test_centroid_after_list_grows(self):
+        """
+        Test that the centroid is re-calculated after vectors are added to or removed from the list of vectors directly.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'b': 2 }), Vector({ 'a': 1, 'c': 1 }) ]
+        c = Cluster()
+        self.assertEqual({ }, c.centroid.dimensions)
+
+        c.vectors.append(v[0])
+        self.assertEqual({ 'a': 1 }, c.centroid.dimensions)
+
+        c.vectors.extend(v[1:])
+        expected = vector_math.normalize(vector_math.concatenate(v))
+        self.assertEqual({ dimension: round(value, 10) for dimension, value in expected.dimensions.items() },
+                         { dimension: round(value, 10) for dimension, value in c.centroid.dimensions.items() })
+
+        c.vectors.remove(v[0])
+        expected = vector_math.normalize(vector_math.concatenate(v[1:]))
+        self.assertEqual({ dimension: round(value, 10) for dimension, value in expected.dimensions.items() },
+                         { dimension: round(value, 10) for dimension, value in c.centroid.dimensions.items() })
+
     def test_set_vectors_none(self):
         """
         Test that setting vectors to ``None`` overwrites existing vectors.
@@ -256,6 +444,37 @@ class TestCluster(unittest.TestCase):
         c.vectors = n
         self.assertEqual(n, c.vectors)
 
+    def test_set_vectors_tuple(self):
+        """
+        Test that setting vectors to a tuple of vectors stores them as a list.
+        """
+
+        v = ( Vector({ 'a': 1 }), Vector({ 'b': 1 }) )
+        c = Cluster(v)
+        self.assertEqual(list(v), c.vectors)
+        self.assertEqual({ 'a', 'b' }, set(c.centroid.dimensions))
+
+    def test_set_vectors_generator(self):
+        """
+        Test that setting vectors to a generator of vectors stores them as a list.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'b': 1 }) ]
+        c = Cluster()
+        c.vectors = ( vector for vector in v )
+        self.assertEqual(v, c.vectors)
+        self.assertEqual({ 'a', 'b' }, set(c.centroid.dimensions))
+
+    def test_set_vectors_own_list(self):
+        """
+        Test that setting the cluster's vectors to its own list keeps the same vectors.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'b': 1 }) ]
+        c = Cluster(v[0])
+        c.vectors += [ v[1] ]
+        self.assertEqual(v, c.vectors)
+
     def test_get_representative_vector(self):
         """
         Test ranking the vectors according to their similarity to the cluster.
@@ -284,6 +503,37 @@ class TestCluster(unittest.TestCase):
         self.assertEqual(list, type(c.get_representative_vectors(2)))
         self.assertEqual([ v[1], v[0] ], c.get_representative_vectors(2))
 
+    def test_get_representative_vectors_similarity_measure(self):
+        """
+        Test that when ranking the vectors with a different similarity measure, the vectors are ranked using that measure.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'a': 10, 'b': 10 }), Vector({ 'b': 1 }) ]
+        c = Cluster(v)
+        self.assertEqual(v[1], c.get_representative_vectors(1))
+        self.assertEqual(v[1], c.get_representative_vectors(1, vector_math.euclidean))
+        self.assertEqual(v[1], c.get_representative_vectors(3, vector_math.euclidean)[0])
+
+    def test_get_representative_vectors_tie(self):
+        """
+        Test that when ranking vectors that have the same similarity, the vectors that were added later are ranked first.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'b': 1 }), Vector({ 'a': 1 }), Vector({ 'b': 1 }) ]
+        c = Cluster(v)
+        self.assertTrue(v[3] is c.get_representative_vectors(1))
+        self.assertEqual([ id(v[3]), id(v[2]), id(v[1]) ], [ id(vector) for vector in c.get_representative_vectors(3) ])
+
+    def test_get_representative_vectors_more_than_size(self):
+        """
+        Test that when asking for more representative vectors than there are in the cluster, all vectors are returned.
+        """
+
+        v = [ Vector({ 'a': 1 }), Vector({ 'a': 1, 'b': 1 }), Vector({ 'b': 1 }) ]
+        c = Cluster(v)
+        self.assertEqual(3, len(c.get_representative_vectors(5)))
+        self.assertEqual(v[1], c.get_representative_vectors(5)[0])
+
     def test_get_representative_vectors_from_empty_cluster(self):
         """
         Test that when getting the representative vectors from an empty cluster, an empty list is returned.
@@ -330,6 +580,25 @@ class TestCluster(unittest.TestCase):
         c = Cluster(v)
         self.assertEqual((c.similarity(v[0]) + c.similarity(v[1]))/2., c.get_intra_similarity())
 
+    def test_intra_similarity_of_cluster_with_empty_vector(self):
+        """
+        Test that the intra-similarity of a cluster with an empty vector treats that vector's similarity as 0.
+        """
+
+        v = [ Vector({ 'a': 1, 'b': 1 }), Vector({ 'a': 1 }), Vector() ]
+        c = Cluster(v)
+        self.assertEqual(sum(vector_math.cosine(c.centroid, vector) for vector in v)/3., c.get_intra_similarity())
+
+    def test_intra_similarity_of_cluster_similarity_measure(self):
+        """
+        Test that the intra-similarity of a cluster uses the given similarity measure.
+        """
+
+        v = [ Vector({ 'a': 1, 'b': 1 }), Vector({ 'a': 1 }) ]
+        c = Cluster(v)
+        self.assertEqual(sum(vector_math.euclidean(c.centroid, vector) for vector in v)/2.,
+                         c.get_intra_similarity(vector_math.euclidean))
+
     def test_size_empty_cluster(self):
         """
         Test that the size of an empty cluster is 0.
@@ -386,6 +655,21 @@ class TestCluster(unittest.TestCase):
         self.assertTrue(all( Vector == type(exported)
                             for imported, exported in zip(v, r.vectors) ))
 
+    def test_export_mixed_vectors(self):
+        """
+        Test that when importing a cluster with vectors of different classes, each vector is imported with its own class.
+        """
+
+        v = [ Vector({ 'a': 1, 'c': 1 }), Document("b", ["a", "c"], scheme=TF()), Vector({ 'b': 1 }) ]
+        c = Cluster(v)
+
+        e = c.to_array()
+        r = Cluster.from_array(e)
+
+        self.assertTrue(all( imported.__dict__ == exported.__dict__
+                            for imported, exported in zip(v, r.vectors) ))
+        self.assertEqual([ Vector, Document, Vector ], [ type(exported) for exported in r.vectors ])
+
     def test_export_attributes(self):
         """
         Test that when exporting and importing clusters, the attributes are included.
@@ -102,6 +102,17 @@ class TestVector(unittest.TestCase):
         v = Vector({ })
         self.assertEqual(0, v.dimensions['x'])
 
+    def test_get_non_existent_dimension_not_added(self):
+        """
+        Test that getting the value of a dimension that does not exist does not add it to the vector.
+        """
+
+        v = Vector({ 'y': 1 })
+        self.assertEqual(0, v.dimensions['x'])
+        self.assertEqual(1, v.dimensions['y'])
+        self.assertEqual({ 'y': 1 }, v.dimensions)
+        self.assertFalse('x' in v.dimensions)
+
     def test_vector_space_initialization(self):
         """
         Test that when providing no dimensions, an empty vector space is created.
@@ -148,6 +159,44 @@ class TestVector(unittest.TestCase):
         v.normalize()
         self.assertEqual(VectorSpace, type(v.dimensions))
 
+    def test_watch_dimensions(self):
+        """
+        Test that the watchers of a vector's dimensions are told when the dimensions change.
+        """
+
+        class Watcher(object):
+            version = 0
+
+        v, w = Vector({ 'x': 1 }), Watcher()
+        v.dimensions.watch(w)
+        v.dimensions.watch(w)
+        v.dimensions['y'] = 1
+        self.assertEqual(1, w.version)
+        del v.dimensions['x']
+        v.dimensions.update({ 'z': 1 })
+        v.dimensions.pop('z')
+        v.dimensions.clear()
+        self.assertEqual(5, w.version)
+
+        v.dimensions = { 'x': 1 }
+        self.assertEqual(6, w.version)
+        v.dimensions['y'] = 1
+        self.assertEqual(6, w.version)
+
+    def test_watch_copy(self):
+        """
+        Test that copies of a vector's dimensions are not watched.
+        """
+
+        class Watcher(object):
+            version = 0
+
+        v, w = Vector({ 'x': 1 }), Watcher()
+        v.dimensions.watch(w)
+        n = v.copy()
+        n.dimensions['y'] = 1
+        self.assertEqual(0, w.version)
+
     def test_copy(self):
         """
         Test copying.
@@ -30,6 +30,49 @@ class TestVectorMath(unittest.TestCase):
         self.assertEqual({"x": 3./math.sqrt(14), "y": math.sqrt(4./14), "z": math.sqrt(1./14)}, normalize(v).dimensions)
         self.assertEqual(1, magnitude(normalize(v)))
 
+    def test_magnitude_repeated(self):
+        """
+        Test that calculating the magnitude of a vector several times always returns the correct magnitude, even after copying or normalizing the vector.
+        """
+
+        v = Vector({ "x": 3, "y": 4 })
+        self.assertEqual(5, magnitude(v))
+        self.assertEqual(5, magnitude(v))
+
+        n = v.copy()
+        n.dimensions['x'] = 0
+        self.assertEqual(4, magnitude(n))
+        self.assertEqual(5, magnitude(v))
+
+        v.normalize()
+        self.assertEqual(1, round(magnitude(v), 10))
+
+    def test_magnitude_after_changes(self):
+        """
+        Test that the magnitude of a vector is re-calculated after its dimensions change.
+        """
+
+        v = Vector({ "x": 3, "y": 4 })
+        self.assertEqual(5, magnitude(v))
+        v.dimensions['y'] = 0
+        self.assertEqual(3, magnitude(v))
+        v.dimensions.update({ 'y': 4 })
+        self.assertEqual(5, magnitude(v))
+        del v.dimensions['x']
+        self.assertEqual(4, magnitude(v))
+        v.dimensions.setdefault('x', 3)
+        self.assertEqual(5, magnitude(v))
+        v.dimensions.pop('x')
+        self.assertEqual(4, magnitude(v))
+        v.dimensions |= { 'x': 3 }
+        self.assertEqual(5, magnitude(v))
+        v.dimensions.popitem()
+        self.assertEqual(4, magnitude(v))
+        v.dimensions.clear()
+        self.assertEqual(0, magnitude(v))
+        v.dimensions = { 'x': 3, 'y': 4 }
+        self.assertEqual(5, magnitude(v))
+
     def test_normalize_empty_vector(self):
         """
         Test that normalizing an empty vector returns the same empty vector.
@@ -67,6 +110,31 @@ class TestVectorMath(unittest.TestCase):
         v = Vector({ })
         self.assertEqual(augmented_normalize(v).dimensions, { })
 
+    def test_normalization_copy(self):
+        """
+        Test that normalizing a vector does not change the original vector.
+        """
+
+        v = Vector({ "x": 3, "y": 4 })
+        n = normalize(v)
+        self.assertEqual({ "x": 0.6, "y": 0.8 }, n.dimensions)
+        self.assertEqual({ "x": 3, "y": 4 }, v.dimensions)
+        self.assertEqual(5, magnitude(v))
+        self.assertEqual(1, magnitude(n))
+
+    def test_augmented_normalization_copy(self):
+        """
+        Test that augmented normalization does not change the original vector, but copies its attributes.
+        """
+
+        v = Vector({ "x": 1, "y": 2, "z": 0 }, { "id": 1 })
+        n = augmented_normalize(v, 0.5)
+        self.assertEqual({ "x": 0.75, "y": 1., "z": 0.5 }, n.dimensions)
+        self.assertEqual({ "x": 1, "y": 2, "z": 0 }, v.dimensions)
+        self.assertEqual({ "id": 1 }, n.attributes)
+        self.assertFalse(n.attributes is v.attributes)
+        self.assertEqual(math.sqrt(1.8125), magnitude(n))
+
     def test_concatenation(self):
         """
         Test the concatenation function.
@@ -181,6 +249,33 @@ class TestVectorMath(unittest.TestCase):
         v1, v2 = Vector({"x": 2, "y": 4}), Vector({"x": -2, "y": 1})
         self.assertEqual(0, round(cosine(v1, v2), 4))
 
+    def test_cosine_different_dimensions(self):
+        """
+        Test that the cosine similarity of vectors with different dimensions only considers their shared dimensions.
+        """
+
+        v1, v2 = Vector({ "x": 1, "y": 2, "z": 2 }), Vector({ "x": 3, "w": 4 })
+        self.assertEqual(round(3/15, 10), round(cosine(v1, v2), 10))
+        self.assertEqual(round(3/15, 10), round(cosine(v2, v1), 10))
+
+    def test_cosine_disjoint_vectors(self):
+        """
+        Test that the cosine similarity of vectors that share no dimensions is 0.
+        """
+
+        v1, v2 = Vector({ "x": 1, "y": 2 }), Vector({ "z": 3 })
+        self.assertEqual(0, cosine(v1, v2))
+
+    def test_cosine_given_magnitude(self):
+        """
+        Test that the cosine similarity uses the magnitude of the first vector if it is given.
+        """
+
+        v1, v2 = Vector({ "x": 1, "y": 2, "z": 2 }), Vector({ "x": 3, "w": 4 })
+        self.assertEqual(cosine(v1, v2), cosine(v1, v2, magnitude(v1)))
+        self.assertEqual(cosine(v1, v2) / 2, cosine(v1, v2, 2 * magnitude(v1)))
+        self.assertEqual(0, cosine(v1, v2, 0))
+
     def test_cosine_distance(self):
         """
         Test the cosine distance.
@@ -6,6 +6,7 @@ Therefore the :class:`~VectorSpace` is one of the most important classes in Even
 
 import os
 import sys
+import weakref
 
 path = os.path.join(os.path.dirname(__file__), "..")
 if path not in sys.path:
@@ -23,24 +24,132 @@ class VectorSpace(dict):
         - The keys of this dictionary represent the feature or dimension name.
         - The corresponding values represent the magnitude of the :class:`~Vector` along that dimension.
 
-    The only change from the normal dictionary is that the value of an unspecified dimension is not undefined or ``None``.
+    The main change from the normal dictionary is that the value of an unspecified dimension is not undefined or ``None``.
     Instead, the :class:`~VectorSpace` returns 0: a :class:`~Vector` is made up of all dimensions, but some (or many) of them have a magnitude of 0.
-    This functionality is implemented in the :func:`~VectorSpace.__getitem__` function.
+    This functionality is implemented in the :func:`~VectorSpace.__missing__` function, which Python calls only when the dimension does not exist.
+    Reading a dimension that exists is as fast as with a normal dictionary.
+
+    The :class:`~VectorSpace` also caches the magnitude of its :class:`~Vector` so that :func:`~vsm.vector_math.magnitude` does not re-calculate it every time.
+    All of the functions that change the dimensions reset this cache.
+
+    Other objects can :func:`~VectorSpace.watch` the :class:`~VectorSpace` to know when the dimensions change, without checking them.
+    Every time that the dimensions change, the :class:`~VectorSpace` increases the ``version`` of all of its watchers.
+    For example, the :class:`~vsm.clustering.cluster.Cluster` watches its vectors' dimensions to know when its centroid needs to be re-calculated.
+
+    :ivar _magnitude: The cached magnitude of the dimensions, or ``None`` if it has not been calculated since the dimensions last changed.
+    :vartype _magnitude: float or None
+    :ivar _watchers: Weak references to the objects that watch the dimensions, or ``None`` if no object watches them.
+    :vartype _watchers: list of :class:`weakref.ref` or None
     """
 
-    def __getitem__(self, key):
+    _magnitude = None
+    _watchers = None
+
+    def __missing__(self, key):
         """
-        Get the value, or magnitude, of the dimension having the given key as name.
-        If the :class:`~Vector` has no dimension with that name, the function returns a magnitude of 0.
+        Get the value, or magnitude, of the dimension having the given key as name when the :class:`~Vector` has no dimension with that name.
+        The function returns a magnitude of 0 without adding the dimension to the :class:`~Vector`.
 
         :param key: The name of the dimension whose magnitude will be fetched.
         :type key: str
 
-        :return: The magnitude of the dimension, or 0 if the :class:`~Vector` does not have a value for the dimension.
-        :rtype: float
+        :return: A magnitude of 0, since the :class:`~Vector` does not have a value for the dimension.
+        :rtype: int
+        """
+
+        return 0
+
+    def __setitem__(self, key, value):
+        """
+        Set the value, or magnitude, of the dimension having the given key as name.
+
+        :param key: The name of the dimension whose magnitude will be set.
+        :type key: str
+        :param value: The new magnitude of the dimension.
+        :type value: float
+        """
+
+        self._changed()
+        super(VectorSpace, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        """
+        Remove the dimension having the given key as name.
+
+        :param key: The name of the dimension to remove.
+        :type key: str
+        """
+
+        self._changed()
+        super(VectorSpace, self).__delitem__(key)
+
+    def __ior__(self, *args, **kwargs):
+        self._changed()
+        return super(VectorSpace, self).__ior__(*args, **kwargs)
+
+    def clear(self, *args, **kwargs):
+        self._changed()
+        super(VectorSpace, self).clear(*args, **kwargs)
+
+    def pop(self, *args, **kwargs):
+        self._changed()
+        return super(VectorSpace, self).pop(*args, **kwargs)
+
+    def popitem(self, *args, **kwargs):
+        self._changed()
+        return super(VectorSpace, self).popitem(*args, **kwargs)
+
+    def setdefault(self, *args, **kwargs):
+        self._changed()
+        return super(VectorSpace, self).setdefault(*args, **kwargs)
+
+    def update(self, *args, **kwargs):
+        self._changed()
+        super(VectorSpace, self).update(*args, **kwargs)
+
+    def __getstate__(self):
+        """
+        Get the state of the :class:`~VectorSpace` when it is copied or pickled.
+        Copies have no cached magnitude and no watchers: the cache is re-calculated when it is needed, and the watchers only watch the original dimensions.
+
+        :return: ``None``, since only the dimensions themselves are copied.
+        :rtype: None
         """
 
-        return self.get(key, 0)
+        return None
+
+    def watch(self, watcher):
+        """
+        Start watching the dimensions.
+        Every time that the dimensions change, the watcher's ``version`` is increased.
+        The :class:`~VectorSpace` only keeps a weak reference to the watcher, so watching the dimensions does not keep the watcher alive.
+
+        :param watcher: The object that will watch the dimensions.
+                        The object must have an integer ``version`` attribute, and it must support weak references.
+        :type watcher: object
+        """
+
+        watchers = self._watchers
+        if watchers is None:
+            self._watchers = [ weakref.ref(watcher) ]
+        elif not any(ref() is watcher for ref in watchers):
+            """
+            Forget the watchers that no longer exist before adding the new one.
+            """
+            watchers[:] = [ ref for ref in watchers if ref() is not None ]
+            watchers.append(weakref.ref(watcher))
+
+    def _changed(self):
+        """
+        Reset the cached magnitude and increase the version of all watchers after the dimensions change.
+        """
+
+        self._magnitude = None
+        if self._watchers:
+            for ref in self._watchers:
+                watcher = ref()
+                if watcher is not None:
+                    watcher.version += 1
 
 class Vector(Attributable, Exportable):
     """
@@ -97,6 +206,13 @@ class Vector(Attributable, Exportable):
         :type dimensions: dict or :class:`~VectorSpace` or ``None``
         """
 
+        """
+        Replacing the dimensions is a change to the previous dimensions as far as their watchers are concerned.
+        """
+        previous = getattr(self, '_Vector__dimensions', None)
+        if previous is not None:
+            previous._changed()
+
         self.__dimensions = VectorSpace() if dimensions is None else VectorSpace(dimensions)
 
     def normalize(self):
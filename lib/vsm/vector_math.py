@@ -4,6 +4,7 @@ This script contains a list of mathematical functions that can be used to change
 """
 
 import math
+import operator
 import os
 import sys
 
@@ -31,7 +32,21 @@ def magnitude(v):
     :rtype: float
     """
 
-    return math.sqrt(sum([value ** 2 for value in v.dimensions.values()]))
+    """
+    The :class:`~vsm.vector.VectorSpace` caches the magnitude until its dimensions change.
+    Other dictionaries have no cache, so their magnitude is always calculated.
+
+    The squares are calculated by multiplying each value by itself, which is faster than raising it to a power and always rounded correctly.
+    """
+    dimensions = v.dimensions
+    if not hasattr(dimensions, '_magnitude'):
+        values = dimensions.values()
+        return math.sqrt(sum(map(operator.mul, values, values)))
+
+    if dimensions._magnitude is None:
+        values = dimensions.values()
+        dimensions._magnitude = math.sqrt(sum(map(operator.mul, values, values)))
+    return dimensions._magnitude
 
 def normalize(v):
     """
@@ -57,11 +72,13 @@ def normalize(v):
     :rtype: :class:`~vsm.vector.Vector`
     """
 
-    n = v.copy()
-
-    m = magnitude(n)
+    """
+    The new :class:`~vsm.vector.Vector` is created from the normalized dimensions, so the given :class:`~vsm.vector.Vector` does not need to be copied.
+    This also re-uses the magnitude that the given :class:`~vsm.vector.Vector` may have cached.
+    """
+    m = magnitude(v)
     if m > 0:
-        dimensions = { dimension: float(value)/m for dimension, value in n.dimensions.items() }
+        dimensions = { dimension: float(value)/m for dimension, value in v.dimensions.items() }
         return vector.Vector(dimensions)
     else:
         return v
@@ -101,12 +118,15 @@ def augmented_normalize(v, a=0.5):
     if not 0 <= a <= 1:
         raise ValueError(f"The augmentation must be between 0 and 1 inclusive, {a} received")
 
+    """
+    The copy's dimensions are updated in place.
+    The copy is new, so replacing its dimensions would only copy them again.
+    """
     n = v.copy()
 
     dimensions = n.dimensions
     x = max(dimensions.values()) if len(dimensions) > 0 else 1
-    dimensions = { dimension: a + (1 - a) * value / x for dimension, value in dimensions.items() }
-    n.dimensions = dimensions
+    dimensions.update({ dimension: a + (1 - a) * value / x for dimension, value in dimensions.items() })
     return n
 
 def concatenate(vectors):
@@ -128,10 +148,14 @@ def concatenate(vectors):
     :rtype: :class:`~vsm.vector.Vector`
     """
 
+    """
+    The dimensions are read together with their values, and the concatenated values are read with a bound function.
+    """
     concatenated = { }
+    get = concatenated.get
     for v in vectors:
-        for dimension in v.dimensions:
-            concatenated[dimension] = concatenated.get(dimension, 0) + v.dimensions[dimension]
+        for dimension, value in v.dimensions.items():
+            concatenated[dimension] = get(dimension, 0) + value
 
     return vector.Vector(concatenated)
 
@@ -157,8 +181,12 @@ def euclidean(v1, v2):
     :rtype: float
     """
 
-    dimensions = list(set(v1.dimensions.keys()).union(v2.dimensions.keys()))
-    differences = [ (v1.dimensions[dimension] - v2.dimensions[dimension]) ** 2 for dimension in dimensions ]
+    """
+    The magnitudes are looked up directly in the dictionaries, with missing dimensions having a magnitude of 0.
+    """
+    d1, d2 = v1.dimensions, v2.dimensions
+    get1, get2 = d1.get, d2.get
+    differences = [ (get1(dimension, 0) - get2(dimension, 0)) ** 2 for dimension in set(d1.keys()).union(d2.keys()) ]
     return math.sqrt(sum(differences))
 
 def manhattan(v1, v2):
@@ -183,11 +211,15 @@ def manhattan(v1, v2):
     :rtype: float
     """
 
-    dimensions = list(set(v1.dimensions.keys()).union(v2.dimensions.keys()))
-    differences = [ abs(v1.dimensions[dimension] - v2.dimensions[dimension]) for dimension in dimensions ]
+    """
+    The magnitudes are looked up directly in the dictionaries, with missing dimensions having a magnitude of 0.
+    """
+    d1, d2 = v1.dimensions, v2.dimensions
+    get1, get2 = d1.get, d2.get
+    differences = [ abs(get1(dimension, 0) - get2(dimension, 0)) for dimension in set(d1.keys()).union(d2.keys()) ]
     return sum(differences)
 
-def cosine(v1, v2):
+def cosine(v1, v2, m1=None):
     """
     Compute the cosine similarity between the two :class:`~vsm.vector.Vector` instances.
     The cosine similarity :math:`cos_{p, q}` is computed as:
@@ -203,16 +235,31 @@ def cosine(v1, v2):
     :type v1: :class:`~vsm.vector.Vector`
     :param v2: The second :class:`~vsm.vector.Vector`.
     :type v2: :class:`~vsm.vector.Vector`
+    :param m1: The magnitude of the first :class:`~vsm.vector.Vector`.
+               If it is given, the function does not look it up, which is useful when comparing the same :class:`~vsm.vector.Vector` with many others.
+               If ``None`` is given, the function calculates it.
+    :type m1: float or None
 
     :return: The cosine similarity between the two :class:`~vsm.vector.Vector` instances.
              This similarity is bound between 0 and 1.
     :rtype: float
     """
 
-    m1, m2 = magnitude(v1), magnitude(v2)
+    m1 = magnitude(v1) if m1 is None else m1
+    m2 = magnitude(v2)
     if (m1 > 0 and m2 > 0):
-        dimensions = set(list(v1.dimensions.keys()) + list(v2.dimensions.keys()))
-        products = [ v1.dimensions[dimension] * v2.dimensions[dimension] for dimension in dimensions ]
+        """
+        Dimensions that only one of the vectors has add nothing to the dot product.
+        Therefore the function only goes through the dimensions of the vector with fewer dimensions, and looks them up in the other vector.
+        If the vectors have no dimensions in common, the dot product is 0, which the function checks first without calculating any products.
+        """
+        d1, d2 = v1.dimensions, v2.dimensions
+        if len(d1) > len(d2):
+            d1, d2 = d2, d1
+        if d1.keys().isdisjoint(d2.keys()):
+            return 0.
+
+        products = [ magnitude * d2.get(dimension, 0) for dimension, magnitude in d1.items() ]
         return sum(products) / (m1 * m2)
     else:
         return 0